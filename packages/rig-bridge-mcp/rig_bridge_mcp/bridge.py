@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict
-import json
 
+from rig_core import jsonutil
 from rig_core.registry import ToolRegistry
 from rig_core.runtime import RigRuntime, CallContext
 
@@ -98,7 +98,7 @@ class RigMcpBridge:
                     "approval_token": result.approval_required.approval_token,
                     "risk_class": result.approval_required.risk_class,
                 }
-                return json.dumps(error_msg, indent=2)
+                return jsonutil.dumps(error_msg, indent=True)
 
             # Handle errors
             if result.error:
@@ -108,11 +108,11 @@ class RigMcpBridge:
                     "details": result.error.details,
                     "retryable": result.error.retryable,
                 }
-                return json.dumps(error_msg, indent=2)
+                return jsonutil.dumps(error_msg, indent=True)
 
             # Return success result
             if isinstance(result.data, (dict, list)):
-                return json.dumps(result.data, indent=2)
+                return jsonutil.dumps(result.data, indent=True)
             else:
                 return str(result.data)
 
@@ -6,7 +6,6 @@ with handlers that execute through the RIG runtime.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
@@ -14,6 +13,7 @@ if TYPE_CHECKING:
     from rig_core.runtime import RigRuntime
     from rig_core.registry import ToolRegistry
 
+from rig_core import jsonutil
 from rig_core.rtp import CallContext
 
 
@@ -50,6 +50,15 @@ class OpenAIToolHandler:
         Returns:
             JSON string of tool output or error
         """
+        return jsonutil.dumps(self.call_raw(arguments, tenant_id, run_id), indent=True)
+    
+    def call_raw(
+        self,
+        arguments: Dict[str, Any],
+        tenant_id: str = "default",
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Execute the tool and return the output or error dict without encoding it."""
         import uuid
         
         ctx = CallContext(
@@ -60,7 +69,7 @@ class OpenAIToolHandler:
         result = self.runtime.call(self.tool_name, arguments, ctx)
         
         if result.ok:
-            return json.dumps(result.output, indent=2)
+            return result.output
         else:
             error_response = {
                 "error": True,
@@ -70,7 +79,7 @@ class OpenAIToolHandler:
             if result.error and result.error.type == "approval_required":
                 error_response["approval_required"] = True
                 error_response["hints"] = result.error.remediation_hints
-            return json.dumps(error_response, indent=2)
+            return error_response
 
 
 def openai_tools(
@@ -3,10 +3,12 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional, Tuple
 
 
 # Event outcome types
@@ -54,21 +56,68 @@ class AuditEvent:
     args_sanitized: Optional[Dict[str, Any]] = None
 
 
+_INSERT_EVENT = """
+    INSERT INTO audit_events (
+        timestamp, tenant_id, run_id, tool, input_hash, outcome, duration_ms,
+        redacted_auth_marker, ts_unix, error_type, pack, pack_version,
+        interface_hash, args_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _event_row(event: AuditEvent) -> Tuple[Any, ...]:
+    return (
+        event.timestamp,
+        event.tenant_id,
+        event.run_id,
+        event.tool,
+        event.input_hash,
+        event.outcome,
+        event.duration_ms,
+        event.redacted_auth_marker,
+        event.ts_unix,
+        event.error_type,
+        event.pack,
+        event.pack_version,
+        event.interface_hash,
+        json.dumps(event.args_sanitized) if event.args_sanitized is not None else None,
+    )
+
+
 class AuditLog:
     """SQLite audit sink for RIG v0.
 
-    v0 default path: .rig/rig_audit.sqlite
+    v0 default path: .rig/rig_audit.sqlite; ":memory:" keeps the log in RAM.
 
     Events are append-only and queryable by run_id and tenant_id.
     """
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
+        # ":memory:" databases live only as long as their connection, so
+        # one is held open and shared (under a lock) for the log's lifetime
+        self._memory: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.Lock()
+        if db_path == ":memory:":
+            self._memory = sqlite3.connect(db_path, check_same_thread=False)
+            self._memory.row_factory = sqlite3.Row
         self._init_db()
 
-    def _init_db(self) -> None:
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if self._memory is not None:
+            with self._memory_lock:
+                yield self._memory
+            return
         conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
         try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
             # Create v0 events table with all required fields
             conn.execute(
                 """
@@ -99,67 +148,34 @@ class AuditLog:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON audit_events(timestamp)")
 
             conn.commit()
-        finally:
-            conn.close()
 
     def write(self, event: AuditEvent) -> None:
         """Write an event to the audit log (append-only)."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT INTO audit_events (
-                    timestamp, tenant_id, run_id, tool, input_hash, outcome, duration_ms,
-                    redacted_auth_marker, ts_unix, error_type, pack, pack_version,
-                    interface_hash, args_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event.timestamp,
-                    event.tenant_id,
-                    event.run_id,
-                    event.tool,
-                    event.input_hash,
-                    event.outcome,
-                    event.duration_ms,
-                    event.redacted_auth_marker,
-                    event.ts_unix,
-                    event.error_type,
-                    event.pack,
-                    event.pack_version,
-                    event.interface_hash,
-                    json.dumps(event.args_sanitized) if event.args_sanitized is not None else None,
-                ),
-            )
+        self.write_many([event])
+
+    def write_many(self, events: Iterable[AuditEvent]) -> None:
+        """Write several events in one transaction (append-only)."""
+        with self._connect() as conn:
+            conn.executemany(_INSERT_EVENT, (_event_row(e) for e in events))
             conn.commit()
-        finally:
-            conn.close()
 
     def query_by_run_id(self, run_id: str) -> list[Dict[str, Any]]:
         """Query events by run_id."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT * FROM audit_events WHERE run_id = ? ORDER BY timestamp",
                 (run_id,)
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def query_by_tenant_id(self, tenant_id: str, limit: int = 100) -> list[Dict[str, Any]]:
         """Query events by tenant_id."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT * FROM audit_events WHERE tenant_id = ? ORDER BY timestamp DESC LIMIT ?",
                 (tenant_id, limit)
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
 
 def compute_input_hash(args: Dict[str, Any]) -> str:
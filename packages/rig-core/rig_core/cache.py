@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from rig_core import jsonutil
+from rig_core.rtp import CallContext
+
+
+def _cache_key(args: Dict[str, Any], secrets: Dict[str, str]) -> bytes:
+    """Hash args and the full secret values into a cache key.
+
+    Secrets are hashed whole rather than by prefix: many tokens share a
+    fixed prefix (e.g. Slack's "xoxb-"), and a prefix key would serve one
+    tenant's cached response to another.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(jsonutil.dumps_bytes(args, sort_keys=True))
+    for name in sorted(secrets):
+        h.update(b"\0" + name.encode() + b"\0" + secrets[name].encode())
+    return h.digest()
+
+
+def ttl_cache(ttl: float = 60.0, maxsize: int = 1024) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache a read tool's output per (args, secrets) for ``ttl`` seconds.
+
+    Works for sync and coroutine impls. Errors are never cached. Entries are
+    deep-copied on the way in and out, so no caller can mutate what a later
+    hit returns, nested lists and dicts included.
+    """
+
+    def decorator(impl: Callable[..., Any]) -> Callable[..., Any]:
+        entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        lock = threading.Lock()
+
+        def lookup(key: bytes) -> Dict[str, Any] | None:
+            with lock:
+                hit = entries.get(key)
+                if hit is None:
+                    return None
+                if hit[0] <= time.monotonic():
+                    del entries[key]
+                    return None
+                entries.move_to_end(key)
+                return copy.deepcopy(hit[1])
+
+        def store(key: bytes, out: Dict[str, Any]) -> None:
+            with lock:
+                entries[key] = (time.monotonic() + ttl, copy.deepcopy(out))
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+        if inspect.iscoroutinefunction(impl):
+
+            @functools.wraps(impl)
+            async def async_wrapper(args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext) -> Dict[str, Any]:
+                key = _cache_key(args, secrets)
+                out = lookup(key)
+                if out is None:
+                    out = await impl(args, secrets, ctx)
+                    store(key, out)
+                return out
+
+            async_wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+            return async_wrapper
+
+        @functools.wraps(impl)
+        def wrapper(args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext) -> Dict[str, Any]:
+            key = _cache_key(args, secrets)
+            out = lookup(key)
+            if out is None:
+                out = impl(args, secrets, ctx)
+                store(key, out)
+            return out
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+# orjson parses bytes directly, with no str decode step.
+loads = orjson.loads
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a JSON string, compact or indented by two spaces."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+
+def dumps_bytes(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, ready to write to the wire."""
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
@@ -34,6 +34,7 @@ class NodeRunnerClient:
                 retryable=bool(err.get("retryable", False)),
                 upstream_code=err.get("upstream_code"),
                 remediation_hints=list(err.get("remediation_hints") or []),
+                retry_after_seconds=err.get("retry_after_seconds"),
             )
         )
 
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib.metadata import entry_points
-from typing import Dict, Iterable, List, Protocol
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Protocol, Sequence, Tuple
 
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import RegisteredTool, ToolImpl
 
 
 class RigPack(Protocol):
-    def rig_pack_metadata(self) -> Dict[str, str]:
+    def rig_pack_metadata(self) -> Mapping[str, str]:
         ...
 
-    def rig_tools(self) -> List[ToolDef]:
+    def rig_tools(self) -> Sequence[ToolDef]:
         ...
 
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
+    def rig_impls(self) -> Mapping[str, RegisteredTool]:
         ...
 
 
@@ -23,8 +24,62 @@ class RigPack(Protocol):
 class LoadedPack:
     name: str
     version: str
-    tools: List[ToolDef]
-    impls: Dict[str, RegisteredTool]
+    tools: Sequence[ToolDef]
+    impls: Mapping[str, RegisteredTool]
+
+
+@dataclass(slots=True, frozen=True)
+class StaticPack:
+    """A pack whose tools and impls are fixed at import time."""
+
+    name: str
+    version: str
+    tools: Tuple[ToolDef, ...] = field(repr=False)
+    impls: Mapping[str, RegisteredTool] = field(repr=False, compare=False)
+    meta: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "meta", MappingProxyType({"name": self.name, "version": self.version}))
+
+    def rig_pack_metadata(self) -> Mapping[str, str]:
+        return self.meta
+
+    def rig_tools(self) -> Tuple[ToolDef, ...]:
+        return self.tools
+
+    def rig_impls(self) -> Mapping[str, RegisteredTool]:
+        return self.impls
+
+
+def make_pack(
+    name: str,
+    version: str,
+    tool_defs: Iterable[ToolDef],
+    tool_impls: Mapping[str, ToolImpl],
+) -> StaticPack:
+    """Build a pack object, registering every impl against its ToolDef.
+
+    Tools without an impl are listed but not registered; an impl without a
+    ToolDef is a packaging mistake and raises ValueError.
+    """
+    tools = tuple(tool_defs)
+    defs_by_name = {tool.name: tool for tool in tools}
+    orphans = tool_impls.keys() - defs_by_name.keys()
+    if orphans:
+        raise ValueError(f"{name}: impls without a ToolDef: {', '.join(sorted(orphans))}")
+    impls = {
+        tool_name: RegisteredTool(tool=defs_by_name[tool_name], impl=impl, pack=name, pack_version=version)
+        for tool_name, impl in tool_impls.items()
+    }
+    return StaticPack(name=name, version=version, tools=tools, impls=impls)
+
+
+def _load(ep) -> LoadedPack:
+    pack: RigPack = ep.load()  # type: ignore
+    meta = pack.rig_pack_metadata()
+    tools = pack.rig_tools()
+    impls = pack.rig_impls()
+    return LoadedPack(name=meta.get("name", ep.name), version=meta.get("version", "0.0.0"), tools=tools, impls=impls)
 
 
 def discover_packs() -> List[LoadedPack]:
@@ -36,21 +91,26 @@ def discover_packs() -> List[LoadedPack]:
 
     eps = entry_points()
     group = eps.select(group="rig.packs")
-
-    out: List[LoadedPack] = []
-    for ep in group:
-        obj = ep.load()
-        pack: RigPack = obj  # type: ignore
-        meta = pack.rig_pack_metadata()
-        tools = pack.rig_tools()
-        impls = pack.rig_impls()
-        out.append(LoadedPack(name=meta.get("name", ep.name), version=meta.get("version", "0.0.0"), tools=tools, impls=impls))
-    return out
+    return [_load(ep) for ep in group]
 
 
 def load_selected_packs(pack_names: Iterable[str] | None = None) -> List[LoadedPack]:
-    packs = discover_packs()
+    """Load the named packs without importing the others.
+
+    Entry points named after a selected pack are loaded directly. Only if a
+    name is left over (an entry point named differently from its pack) are
+    the remaining entry points imported to match on their metadata.
+    """
     if pack_names is None:
-        return packs
+        return discover_packs()
     allow = set(pack_names)
-    return [p for p in packs if p.name in allow]
+    group = entry_points().select(group="rig.packs")
+
+    # An entry point can share a selected name while its pack is named
+    # otherwise; only the pack name decides what is loaded
+    out = [p for p in (_load(ep) for ep in group if ep.name in allow) if p.name in allow]
+    missing = allow - {p.name for p in out}
+    if missing:
+        rest = (_load(ep) for ep in group if ep.name not in allow)
+        out += [p for p in rest if p.name in missing]
+    return out
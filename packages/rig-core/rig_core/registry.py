@@ -25,15 +25,23 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: Dict[str, ToolDef] = {}
         self._pack_set_version: str = "dev"
+        self._revision: int = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change, for caches derived from the catalog."""
+        return self._revision
 
     def set_pack_set_version(self, version: str) -> None:
         self._pack_set_version = version
+        self._revision += 1
 
     def register_tools(self, tool_defs: Iterable[ToolDef]) -> None:
         for t in tool_defs:
             if t.name in self._tools:
                 raise ValueError(f"duplicate tool name: {t.name}")
             self._tools[t.name] = t
+            self._revision += 1
 
     def list_tools(self) -> List[ToolDef]:
         return [self._tools[k] for k in sorted(self._tools.keys())]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
 RiskClass = Literal["read", "write", "infra", "money", "destructive"]
 
 ErrorType = Literal[
@@ -40,6 +45,36 @@ class ToolDef:
     policy_defaults: Dict[str, Any] = field(default_factory=dict)
     examples: List[Dict[str, Any]] = field(default_factory=list)
 
+    @cached_property
+    def input_validator(self) -> Validator:
+        return compile_validator(self.input_schema)
+
+    @cached_property
+    def output_validator(self) -> Validator:
+        return compile_validator(self.output_schema)
+
+    def validate_input(self, args: Dict[str, Any]) -> None:
+        """Raise jsonschema.ValidationError if args do not match input_schema."""
+        check_instance(self.input_validator, args)
+
+    def validate_output(self, out: Dict[str, Any]) -> None:
+        """Raise jsonschema.ValidationError if out does not match output_schema."""
+        check_instance(self.output_validator, out)
+
+
+def compile_validator(schema: Dict[str, Any]) -> Validator:
+    """Check a schema once and build a reusable validator for it."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def check_instance(validator: Validator, instance: Any) -> None:
+    """Raise the same error jsonschema.validate() would for this instance."""
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
 
 @dataclass
 class ToolError:
@@ -49,6 +84,20 @@ class ToolError:
     upstream_code: Optional[str] = None
     remediation_hints: List[str] = field(default_factory=list)
     correlation_id: Optional[str] = None
+    # Upstream's Retry-After, for callers pacing their own retries
+    retry_after_seconds: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Wire form, matching schemas/rtp/ToolError.schema.json."""
+        return {
+            "type": self.type,
+            "message": self.message,
+            "retryable": self.retryable,
+            "upstream_code": self.upstream_code,
+            "remediation_hints": self.remediation_hints,
+            "correlation_id": self.correlation_id,
+            "retry_after_seconds": self.retry_after_seconds,
+        }
 
 
 @dataclass
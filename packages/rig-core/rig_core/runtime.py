@@ -1,18 +1,42 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import threading
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
 
 from rig_core.audit import AuditLog, compute_input_hash, now_event
 from rig_core.policy import Policy
 from rig_core.rtp import CallContext, ToolDef, ToolError, ToolResult
 from rig_core.secrets import SecretsStore
 
-ToolImpl = Callable[[Dict[str, Any], Dict[str, str], CallContext], Dict[str, Any]]
+ToolImpl = Callable[
+    [Dict[str, Any], Dict[str, str], CallContext],
+    Union[Dict[str, Any], Awaitable[Dict[str, Any]]],
+]
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _run_coroutine(coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a coroutine impl to completion from sync code.
+
+    Uses one long-lived event loop thread instead of asyncio.run() per call,
+    so async clients cached by packs keep their connection pools.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="rig-runtime-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
 
 
 class RigToolRaised(Exception):
@@ -23,12 +47,20 @@ class RigToolRaised(Exception):
         self.err = err
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisteredTool:
     tool: ToolDef
     impl: ToolImpl
     pack: str = "local"
     pack_version: str = "dev"
+    # Read-only and credential-free: the runtime skips secret resolution.
+    pure: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.pure = not self.tool.auth_slots and self.tool.risk_class == "read"
+        # Build both validators now so bad schemas fail at registration
+        self.tool.input_validator
+        self.tool.output_validator
 
 
 class ApprovalStore:
@@ -78,20 +110,75 @@ class RigRuntime:
         start_time = time.time()
         correlation_id = ctx.get("request_id") or str(uuid.uuid4())
 
+        reg, rejected = self._admit(tool_name, args, ctx, correlation_id)
+        if rejected is not None:
+            duration_ms = int((time.time() - start_time) * 1000)
+            self._audit(tool_name, args, ctx, rejected, duration_ms, None)
+            return rejected
+
+        # Resolve secrets and track which auth slots are used
+        secrets, auth_marker = self._resolve_secrets(reg, ctx)
+
+        result = self._execute(reg, args, secrets, ctx, correlation_id)
+        duration_ms = int((time.time() - start_time) * 1000)
+        self._audit(tool_name, args, ctx, result, duration_ms, auth_marker)
+        return result
+
+    async def acall(self, tool_name: str, args: Dict[str, Any], ctx: CallContext) -> ToolResult:
+        """Async variant of call().
+
+        Coroutine impls are awaited on the running loop; sync impls run in a
+        worker thread so they do not block other in-flight calls.
+        """
+        start_time = time.time()
+        correlation_id = ctx.get("request_id") or str(uuid.uuid4())
+
+        reg, rejected = self._admit(tool_name, args, ctx, correlation_id)
+        if rejected is not None:
+            duration_ms = int((time.time() - start_time) * 1000)
+            self._audit(tool_name, args, ctx, rejected, duration_ms, None)
+            return rejected
+
+        secrets, auth_marker = self._resolve_secrets(reg, ctx)
+
+        result = await self._aexecute(reg, args, secrets, ctx, correlation_id)
+        duration_ms = int((time.time() - start_time) * 1000)
+        self._audit(tool_name, args, ctx, result, duration_ms, auth_marker)
+        return result
+
+    async def call_many(self, calls: Iterable[Tuple[str, Dict[str, Any], CallContext]]) -> List[ToolResult]:
+        """Run independent tool calls concurrently.
+
+        Args:
+            calls: (tool_name, args, ctx) tuples
+
+        Returns:
+            One ToolResult per call, in the same order
+        """
+        return list(await asyncio.gather(*(self.acall(name, args, ctx) for name, args, ctx in calls)))
+
+    def _admit(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        ctx: CallContext,
+        correlation_id: str,
+    ) -> Tuple[Optional[RegisteredTool], Optional[ToolResult]]:
+        """Run lookup, policy, validation and approval checks.
+
+        Returns the registered tool, or the result to return instead of
+        executing it.
+        """
         reg = self._tools.get(tool_name)
         if not reg:
-            duration_ms = int((time.time() - start_time) * 1000)
-            result = ToolResult(
+            return None, ToolResult(
                 ok=False,
                 error=ToolError(type="not_found", message="tool not found", correlation_id=correlation_id),
                 correlation_id=correlation_id,
             )
-            self._audit(tool_name, args, ctx, result, duration_ms, None)
-            return result
 
         if not self.policy.is_tool_allowed(tool_name):
-            duration_ms = int((time.time() - start_time) * 1000)
-            result = ToolResult(
+            return reg, ToolResult(
                 ok=False,
                 error=ToolError(type="policy_blocked", message="tool not allowed by policy", correlation_id=correlation_id),
                 correlation_id=correlation_id,
@@ -100,14 +187,11 @@ class RigRuntime:
                 interface_hash=self._interface_hash,
                 pack_set_version=self._pack_set_version,
             )
-            self._audit(tool_name, args, ctx, result, duration_ms, None)
-            return result
 
         try:
-            validate(instance=args, schema=reg.tool.input_schema)
+            reg.tool.validate_input(args)
         except ValidationError as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            result = ToolResult(
+            return reg, ToolResult(
                 ok=False,
                 error=ToolError(type="validation_error", message=str(e), correlation_id=correlation_id),
                 correlation_id=correlation_id,
@@ -116,13 +200,10 @@ class RigRuntime:
                 interface_hash=self._interface_hash,
                 pack_set_version=self._pack_set_version,
             )
-            self._audit(tool_name, args, ctx, result, duration_ms, None)
-            return result
 
         if self.policy.needs_approval(reg.tool.risk_class):
-            duration_ms = int((time.time() - start_time) * 1000)
             token = self.approvals.create(tool_name, args, ctx)
-            result = ToolResult(
+            return reg, ToolResult(
                 ok=False,
                 error=ToolError(
                     type="approval_required",
@@ -137,17 +218,8 @@ class RigRuntime:
                 interface_hash=self._interface_hash,
                 pack_set_version=self._pack_set_version,
             )
-            self._audit(tool_name, args, ctx, result, duration_ms, None)
-            return result
 
-        # Resolve secrets and track which auth slots are used
-        secrets = self.secrets.resolve(reg.tool.auth_slots, ctx.get("tenant_id"))
-        auth_marker = self._get_auth_marker(reg.tool.auth_slots, ctx.get("tenant_id"))
-
-        result = self._execute(reg, args, secrets, ctx, correlation_id)
-        duration_ms = int((time.time() - start_time) * 1000)
-        self._audit(tool_name, args, ctx, result, duration_ms, auth_marker)
-        return result
+        return reg, None
 
     def approve_and_call(self, token: str) -> ToolResult:
         start_time = time.time()
@@ -162,8 +234,7 @@ class RigRuntime:
         if not reg:
             return ToolResult(ok=False, error=ToolError(type="not_found", message="tool not found"))
 
-        secrets = self.secrets.resolve(reg.tool.auth_slots, ctx.get("tenant_id"))
-        auth_marker = self._get_auth_marker(reg.tool.auth_slots, ctx.get("tenant_id"))
+        secrets, auth_marker = self._resolve_secrets(reg, ctx)
         correlation_id = ctx.get("request_id") or str(uuid.uuid4())
         result = self._execute(reg, args, secrets, ctx, correlation_id)
         duration_ms = int((time.time() - start_time) * 1000)
@@ -183,53 +254,84 @@ class RigRuntime:
             attempts += 1
             try:
                 out = reg.impl(args, secrets, ctx)
-                validate(instance=out, schema=reg.tool.output_schema)
-                return ToolResult(
-                    ok=True,
-                    output=out,
-                    correlation_id=correlation_id,
-                    pack=reg.pack,
-                    pack_version=reg.pack_version,
-                    interface_hash=self._interface_hash,
-                    pack_set_version=self._pack_set_version,
-                )
-            except RigToolRaised as rte:
-                err = rte.err
-                if not err.correlation_id:
-                    err.correlation_id = correlation_id
-                return ToolResult(
-                    ok=False,
-                    error=err,
-                    correlation_id=correlation_id,
-                    pack=reg.pack,
-                    pack_version=reg.pack_version,
-                    interface_hash=self._interface_hash,
-                    pack_set_version=self._pack_set_version,
-                )
-            except ValidationError as e:
-                return ToolResult(
-                    ok=False,
-                    error=ToolError(type="internal_error", message=f"output schema mismatch: {e}", correlation_id=correlation_id),
-                    correlation_id=correlation_id,
-                    pack=reg.pack,
-                    pack_version=reg.pack_version,
-                    interface_hash=self._interface_hash,
-                    pack_set_version=self._pack_set_version,
-                )
+                if asyncio.iscoroutine(out):
+                    out = _run_coroutine(out)
+                reg.tool.validate_output(out)
+                return self._ok(reg, out, correlation_id)
             except Exception as e:
-                can_retry = attempts <= max(0, self.policy.retries)
-                if can_retry:
+                if self._can_retry(e, attempts):
                     time.sleep(0.25 * attempts)
                     continue
-                return ToolResult(
-                    ok=False,
-                    error=ToolError(type="upstream_error", message=str(e), retryable=False, correlation_id=correlation_id),
-                    correlation_id=correlation_id,
-                    pack=reg.pack,
-                    pack_version=reg.pack_version,
-                    interface_hash=self._interface_hash,
-                    pack_set_version=self._pack_set_version,
-                )
+                return self._failed(reg, e, correlation_id)
+
+    async def _aexecute(
+        self,
+        reg: RegisteredTool,
+        args: Dict[str, Any],
+        secrets: Dict[str, str],
+        ctx: CallContext,
+        correlation_id: str,
+    ) -> ToolResult:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                if inspect.iscoroutinefunction(reg.impl):
+                    out = await reg.impl(args, secrets, ctx)
+                else:
+                    out = await asyncio.to_thread(reg.impl, args, secrets, ctx)
+                    if asyncio.iscoroutine(out):
+                        out = await out
+                reg.tool.validate_output(out)
+                return self._ok(reg, out, correlation_id)
+            except Exception as e:
+                if self._can_retry(e, attempts):
+                    await asyncio.sleep(0.25 * attempts)
+                    continue
+                return self._failed(reg, e, correlation_id)
+
+    def _can_retry(self, e: Exception, attempts: int) -> bool:
+        if isinstance(e, (RigToolRaised, ValidationError)):
+            return False
+        return attempts <= max(0, self.policy.retries)
+
+    def _ok(self, reg: RegisteredTool, out: Dict[str, Any], correlation_id: str) -> ToolResult:
+        return ToolResult(
+            ok=True,
+            output=out,
+            correlation_id=correlation_id,
+            pack=reg.pack,
+            pack_version=reg.pack_version,
+            interface_hash=self._interface_hash,
+            pack_set_version=self._pack_set_version,
+        )
+
+    def _failed(self, reg: RegisteredTool, e: Exception, correlation_id: str) -> ToolResult:
+        if isinstance(e, RigToolRaised):
+            err = e.err
+            if not err.correlation_id:
+                err.correlation_id = correlation_id
+        elif isinstance(e, ValidationError):
+            err = ToolError(type="internal_error", message=f"output schema mismatch: {e}", correlation_id=correlation_id)
+        else:
+            err = ToolError(type="upstream_error", message=str(e), retryable=False, correlation_id=correlation_id)
+        return ToolResult(
+            ok=False,
+            error=err,
+            correlation_id=correlation_id,
+            pack=reg.pack,
+            pack_version=reg.pack_version,
+            interface_hash=self._interface_hash,
+            pack_set_version=self._pack_set_version,
+        )
+
+    def _resolve_secrets(self, reg: RegisteredTool, ctx: CallContext) -> Tuple[Dict[str, str], Optional[str]]:
+        """Resolve secrets for a call, plus the redacted auth marker to audit."""
+        if reg.pure:
+            return {}, None
+        tenant_id = ctx.get("tenant_id")
+        auth_slots = reg.tool.auth_slots
+        return self.secrets.resolve(auth_slots, tenant_id), self._get_auth_marker(auth_slots, tenant_id)
 
     def _get_auth_marker(self, auth_slots: list[str], tenant_id: Optional[str]) -> Optional[str]:
         """Get redacted auth marker indicating which auth slot was used.
@@ -57,12 +57,7 @@ def records_list(
             max_records=args.get("max_records", 100),
         )
         
-        result = []
-        for r in records:
-            result.append({
-                "id": r["id"],
-                "fields": r["fields"],
-            })
+        result = [{"id": r["id"], "fields": r["fields"]} for r in records]
         
         return {"records": result}
     except Exception as e:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from rig_core.policy import Policy
 from rig_core.registry import ToolRegistry
 from rig_core.runtime import RigRuntime
@@ -22,3 +24,23 @@ def test_echo_contract() -> None:
     res = runtime.call("echo", {"message": "hi"}, {"tenant_id": "t1", "request_id": "r1"})
     assert res.ok is True
     assert res.output == {"message": "hi", "tenant_id": "t1"}
+
+
+def test_echo_contract_call_many() -> None:
+    registry = ToolRegistry()
+    runtime = RigRuntime(policy=Policy(), secrets=SecretsStore(), audit=None)
+
+    registry.register_tools(PACK.rig_tools())
+    snap = registry.snapshot()
+    runtime.set_snapshot_meta(interface_hash=snap.interface_hash, pack_set_version=snap.pack_set_version)
+
+    for name, reg in PACK.rig_impls().items():
+        runtime.register(name, reg)
+
+    results = asyncio.run(runtime.call_many([
+        ("echo", {"message": "hi"}, {"tenant_id": "t1", "request_id": "r1"}),
+        ("echo", {"message": "there"}, {"tenant_id": "t2", "request_id": "r2"}),
+    ]))
+    assert [r.ok for r in results] == [True, True]
+    assert results[0].output == {"message": "hi", "tenant_id": "t1"}
+    assert results[1].output == {"message": "there", "tenant_id": "t2"}
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_elevenlabs.tools import voices_list, text_to_speech_create
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="elevenlabs.voices.list",
         description="List available ElevenLabs voices",
@@ -44,35 +45,11 @@ TOOL_DEFS = [
         auth_slots=["ELEVENLABS_API_KEY"],
         risk_class="write",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "elevenlabs.voices.list": voices_list,
     "elevenlabs.textToSpeech.create": text_to_speech_create,
-}
-
-
-@dataclass
-class ElevenLabsPack:
-    name: str = "rig-pack-elevenlabs"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = ElevenLabsPack()
+})
 
+PACK = make_pack("rig-pack-elevenlabs", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
@@ -27,13 +27,14 @@ def voices_list(
         
         response = client.voices.get_all()
         
-        voices = []
-        for v in response.voices:
-            voices.append({
+        voices = [
+            {
                 "voice_id": v.voice_id,
                 "name": v.name,
                 "category": v.category,
-            })
+            }
+            for v in response.voices
+        ]
         
         return {"voices": voices}
     except Exception as e:
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_github.tools import issues_create, issues_comment, pulls_create, pulls_list
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="github.issues.create",
         description="Create a GitHub issue",
@@ -95,37 +96,13 @@ TOOL_DEFS = [
         auth_slots=["GITHUB_TOKEN"],
         risk_class="read",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "github.issues.create": issues_create,
     "github.issues.comment": issues_comment,
     "github.pulls.create": pulls_create,
     "github.pulls.list": pulls_list,
-}
-
-
-@dataclass
-class GitHubPack:
-    name: str = "rig-pack-github"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = GitHubPack()
+})
 
+PACK = make_pack("rig-pack-github", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
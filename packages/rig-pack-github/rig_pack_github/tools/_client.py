@@ -0,0 +1,51 @@
+"""Shared PyGithub clients and repository lookups."""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+REPO_TTL_SECONDS = 300.0
+REPO_CACHE_SIZE = 256
+
+_repos: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def get_client(token: str) -> Any:
+    """Get a cached Github client (and its HTTP session) for a token."""
+    from github import Github
+
+    return Github(token)
+
+
+def get_repo(token: str, full_name: str) -> Any:
+    """Get a Repository, reusing the lookup for REPO_TTL_SECONDS.
+
+    ``Github.get_repo`` issues a GET /repos/{owner}/{repo} on every call;
+    issue and PR tools only need the populated object to build further
+    requests.
+    """
+    key = (token, full_name)
+    now = time.monotonic()
+    with _lock:
+        hit = _repos.get(key)
+    if hit is not None and now - hit[0] < REPO_TTL_SECONDS:
+        return hit[1]
+
+    repo = get_client(token).get_repo(full_name)
+    with _lock:
+        _repos.pop(key, None)
+        _repos[key] = (now, repo)
+        while len(_repos) > REPO_CACHE_SIZE:
+            _repos.pop(next(iter(_repos)))
+    return repo
+
+
+def forget_repo(token: str, full_name: str) -> None:
+    """Drop a cached repository, e.g. after it was renamed or deleted."""
+    with _lock:
+        _repos.pop((token, full_name), None)
@@ -7,6 +7,8 @@ from typing import Any, Dict
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_github.tools._client import forget_repo, get_repo
+
 
 def issues_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
@@ -21,7 +23,7 @@ def issues_create(
     Returns:
         Issue number and URL
     """
-    from github import Github, GithubException
+    from github import GithubException
     
     token = secrets.get("GITHUB_TOKEN")
     if not token:
@@ -32,8 +34,7 @@ def issues_create(
         ))
     
     try:
-        g = Github(token)
-        repo = g.get_repo(args["repo"])
+        repo = get_repo(token, args["repo"])
         
         issue = repo.create_issue(
             title=args["title"],
@@ -47,6 +48,8 @@ def issues_create(
             "state": issue.state,
         }
     except GithubException as e:
+        if e.status == 404:
+            forget_repo(token, args["repo"])
         raise RigToolRaised(ToolError(
             type="upstream_error",
             message=str(e),
@@ -68,7 +71,7 @@ def issues_comment(
     Returns:
         Comment ID and URL
     """
-    from github import Github, GithubException
+    from github import GithubException
     
     token = secrets.get("GITHUB_TOKEN")
     if not token:
@@ -79,8 +82,7 @@ def issues_comment(
         ))
     
     try:
-        g = Github(token)
-        repo = g.get_repo(args["repo"])
+        repo = get_repo(token, args["repo"])
         issue = repo.get_issue(args["issue_number"])
         
         comment = issue.create_comment(args["body"])
@@ -90,6 +92,8 @@ def issues_comment(
             "url": comment.html_url,
         }
     except GithubException as e:
+        if e.status == 404:
+            forget_repo(token, args["repo"])
         raise RigToolRaised(ToolError(
             type="upstream_error",
             message=str(e),
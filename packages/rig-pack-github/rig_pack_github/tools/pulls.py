@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import Any, Dict
 
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_github.tools._client import forget_repo, get_repo
+
 
 def pulls_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
@@ -21,7 +24,7 @@ def pulls_create(
     Returns:
         PR number and URL
     """
-    from github import Github, GithubException
+    from github import GithubException
     
     token = secrets.get("GITHUB_TOKEN")
     if not token:
@@ -32,8 +35,7 @@ def pulls_create(
         ))
     
     try:
-        g = Github(token)
-        repo = g.get_repo(args["repo"])
+        repo = get_repo(token, args["repo"])
         
         pr = repo.create_pull(
             title=args["title"],
@@ -48,6 +50,8 @@ def pulls_create(
             "state": pr.state,
         }
     except GithubException as e:
+        if e.status == 404:
+            forget_repo(token, args["repo"])
         raise RigToolRaised(ToolError(
             type="upstream_error",
             message=str(e),
@@ -69,7 +73,7 @@ def pulls_list(
     Returns:
         List of PRs
     """
-    from github import Github, GithubException
+    from github import GithubException
     
     token = secrets.get("GITHUB_TOKEN")
     if not token:
@@ -80,25 +84,27 @@ def pulls_list(
         ))
     
     try:
-        g = Github(token)
-        repo = g.get_repo(args["repo"])
+        repo = get_repo(token, args["repo"])
         
         prs = repo.get_pulls(
             state=args.get("state", "open"),
             base=args.get("base"),
         )
         
-        result = []
-        for pr in prs[:args.get("limit", 20)]:
-            result.append({
+        result = [
+            {
                 "number": pr.number,
                 "title": pr.title,
                 "state": pr.state,
                 "url": pr.html_url,
-            })
+            }
+            for pr in islice(prs, args.get("limit", 20))
+        ]
         
         return {"pull_requests": result}
     except GithubException as e:
+        if e.status == 404:
+            forget_repo(token, args["repo"])
         raise RigToolRaised(ToolError(
             type="upstream_error",
             message=str(e),
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
-from rig_pack_google.tools import sheets_values_get, sheets_values_update, drive_files_list
+from rig_pack_google.tools import (
+    sheets_values_get,
+    sheets_values_update,
+    sheets_values_batch_update,
+    drive_files_list,
+)
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="google.sheets.values.get",
         description="Get values from a Google Sheet",
@@ -45,6 +51,44 @@ TOOL_DEFS = [
         auth_slots=["GOOGLE_CREDENTIALS_JSON"],
         risk_class="write",
     ),
+    ToolDef(
+        name="google.sheets.values.batchUpdate",
+        description="Update multiple ranges in a Google Sheet in one request",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "spreadsheet_id": {"type": "string"},
+                "data": {
+                    "type": "array",
+                    "description": "Ranges to update",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "range": {"type": "string", "description": "A1 notation range"},
+                            "values": {"type": "array", "description": "2D array of values"},
+                        },
+                        "required": ["range", "values"],
+                    },
+                },
+                "value_input_option": {
+                    "type": "string",
+                    "enum": ["RAW", "USER_ENTERED"],
+                    "default": "USER_ENTERED",
+                },
+            },
+            "required": ["spreadsheet_id", "data"],
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "updated_cells": {"type": "integer"},
+                "updated_ranges": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+        error_schema={"type": "object"},
+        auth_slots=["GOOGLE_CREDENTIALS_JSON"],
+        risk_class="write",
+    ),
     ToolDef(
         name="google.drive.files.list",
         description="List files in Google Drive",
@@ -60,36 +104,13 @@ TOOL_DEFS = [
         auth_slots=["GOOGLE_CREDENTIALS_JSON"],
         risk_class="read",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "google.sheets.values.get": sheets_values_get,
     "google.sheets.values.update": sheets_values_update,
+    "google.sheets.values.batchUpdate": sheets_values_batch_update,
     "google.drive.files.list": drive_files_list,
-}
-
-
-@dataclass
-class GooglePack:
-    name: str = "rig-pack-google"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = GooglePack()
+})
 
+PACK = make_pack("rig-pack-google", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
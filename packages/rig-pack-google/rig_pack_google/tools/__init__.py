@@ -1,7 +1,12 @@
 """Google tool implementations."""
 
-from .sheets import sheets_values_get, sheets_values_update
+from .sheets import sheets_values_get, sheets_values_update, sheets_values_batch_update
 from .drive import drive_files_list
 
-__all__ = ["sheets_values_get", "sheets_values_update", "drive_files_list"]
+__all__ = [
+    "sheets_values_get",
+    "sheets_values_update",
+    "sheets_values_batch_update",
+    "drive_files_list",
+]
 
@@ -0,0 +1,100 @@
+"""Shared HTTP transport for Google REST APIs.
+
+Tools talk to the Sheets and Drive REST endpoints directly through one
+process-wide ``httpx.Client`` with HTTP/2 enabled, instead of building a
+``googleapiclient`` service (httplib2, no HTTP/2, no pooling) per call.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Generator, Optional
+
+import httpx
+from google.auth import exceptions, transport
+from google.oauth2 import service_account
+
+from rig_core import jsonutil
+
+SHEETS_API = "https://sheets.googleapis.com/v4"
+DRIVE_API = "https://www.googleapis.com/drive/v3"
+
+SHEETS_SCOPE = "https://www.googleapis.com/auth/spreadsheets"
+DRIVE_READONLY_SCOPE = "https://www.googleapis.com/auth/drive.readonly"
+
+_HTTPX = httpx.Client(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+)
+
+
+class _AuthResponse(transport.Response):
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
+
+    @property
+    def data(self) -> bytes:
+        return self._response.content
+
+
+class _AuthRequest(transport.Request):
+    """google-auth transport so token refreshes reuse the shared pool."""
+
+    def __call__(self, url, method="GET", body=None, headers=None, timeout=None, **kwargs):
+        try:
+            response = _HTTPX.request(method, url, content=body, headers=headers, timeout=timeout or 30.0)
+        except httpx.HTTPError as e:
+            raise exceptions.TransportError(e) from e
+        return _AuthResponse(response)
+
+
+class GoogleAuth(httpx.Auth):
+    """Bearer auth for a service account.
+
+    The access token is cached on the credentials and only refreshed
+    once it reaches ``creds.expiry``.
+    """
+
+    def __init__(self, creds: service_account.Credentials) -> None:
+        self._creds = creds
+        self._lock = threading.Lock()
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        headers: Dict[str, str] = {}
+        with self._lock:
+            self._creds.before_request(_AuthRequest(), request.method, str(request.url), headers)
+        request.headers.update(headers)
+        yield request
+
+
+@lru_cache(maxsize=32)
+def get_auth(creds_json: str, scope: str) -> GoogleAuth:
+    """Get a cached auth object for a credentials document and scope."""
+    creds_data = jsonutil.loads(creds_json)
+    creds = service_account.Credentials.from_service_account_info(creds_data, scopes=[scope])
+    return GoogleAuth(creds)
+
+
+def request(
+    method: str,
+    url: str,
+    auth: GoogleAuth,
+    params: Optional[Dict[str, Any]] = None,
+    json_body: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Issue an authenticated request and return the decoded JSON body."""
+    if params:
+        params = {k: v for k, v in params.items() if v is not None}
+    response = _HTTPX.request(method, url, params=params, json=json_body, auth=auth)
+    response.raise_for_status()
+    return response.json()
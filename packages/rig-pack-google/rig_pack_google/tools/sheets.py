@@ -3,17 +3,16 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from urllib.parse import quote
 
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_google.tools import _http
 
-def _get_sheets_service(secrets: Dict[str, str]):
-    """Get authenticated Sheets service."""
-    import json
-    from google.oauth2 import service_account
-    from googleapiclient.discovery import build
-    
+
+def _get_sheets_auth(secrets: Dict[str, str]) -> _http.GoogleAuth:
+    """Get authentication for the Sheets API."""
     creds_json = secrets.get("GOOGLE_CREDENTIALS_JSON")
     if not creds_json:
         raise RigToolRaised(ToolError(
@@ -21,12 +20,12 @@ def _get_sheets_service(secrets: Dict[str, str]):
             message="GOOGLE_CREDENTIALS_JSON not configured",
             retryable=False,
         ))
-    
-    creds_data = json.loads(creds_json)
-    creds = service_account.Credentials.from_service_account_info(
-        creds_data, scopes=["https://www.googleapis.com/auth/spreadsheets"]
-    )
-    return build("sheets", "v4", credentials=creds)
+
+    return _http.get_auth(creds_json, _http.SHEETS_SCOPE)
+
+
+def _values_url(spreadsheet_id: str, range_: str) -> str:
+    return f"{_http.SHEETS_API}/spreadsheets/{quote(spreadsheet_id, safe='')}/values/{quote(range_, safe='')}"
 
 
 def sheets_values_get(
@@ -34,13 +33,10 @@ def sheets_values_get(
 ) -> Dict[str, Any]:
     """Get values from a Google Sheet."""
     try:
-        service = _get_sheets_service(secrets)
-        
-        result = service.spreadsheets().values().get(
-            spreadsheetId=args["spreadsheet_id"],
-            range=args["range"],
-        ).execute()
-        
+        auth = _get_sheets_auth(secrets)
+
+        result = _http.request("GET", _values_url(args["spreadsheet_id"], args["range"]), auth)
+
         return {
             "values": result.get("values", []),
             "range": result.get("range"),
@@ -58,17 +54,18 @@ def sheets_values_update(
 ) -> Dict[str, Any]:
     """Update values in a Google Sheet."""
     try:
-        service = _get_sheets_service(secrets)
-        
+        auth = _get_sheets_auth(secrets)
+
         body = {"values": args["values"]}
-        
-        result = service.spreadsheets().values().update(
-            spreadsheetId=args["spreadsheet_id"],
-            range=args["range"],
-            valueInputOption=args.get("value_input_option", "USER_ENTERED"),
-            body=body,
-        ).execute()
-        
+
+        result = _http.request(
+            "PUT",
+            _values_url(args["spreadsheet_id"], args["range"]),
+            auth,
+            params={"valueInputOption": args.get("value_input_option", "USER_ENTERED")},
+            json_body=body,
+        )
+
         return {
             "updated_cells": result.get("updatedCells"),
             "updated_range": result.get("updatedRange"),
@@ -80,3 +77,34 @@ def sheets_values_update(
             retryable=False,
         ))
 
+
+def sheets_values_batch_update(
+    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
+) -> Dict[str, Any]:
+    """Update several ranges of a Google Sheet in a single request."""
+    try:
+        auth = _get_sheets_auth(secrets)
+
+        body = {
+            "valueInputOption": args.get("value_input_option", "USER_ENTERED"),
+            "data": args["data"],
+        }
+
+        result = _http.request(
+            "POST",
+            f"{_http.SHEETS_API}/spreadsheets/{quote(args['spreadsheet_id'], safe='')}/values:batchUpdate",
+            auth,
+            json_body=body,
+        )
+
+        # Ranges Sheets left unchanged come back without updatedRange
+        return {
+            "updated_cells": result.get("totalUpdatedCells", 0),
+            "updated_ranges": [r["updatedRange"] for r in result.get("responses", []) if r.get("updatedRange")],
+        }
+    except Exception as e:
+        raise RigToolRaised(ToolError(
+            type="upstream_error",
+            message=str(e),
+            retryable=False,
+        ))
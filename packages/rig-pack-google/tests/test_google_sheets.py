@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import jsonschema
+
+from rig_pack_google.pack import TOOL_DEFS
+from rig_pack_google.tools import _http, sheets
+
+
+def test_batch_update_skips_responses_without_an_updated_range(monkeypatch) -> None:
+    calls = []
+
+    def fake_request(method, url, auth, json_body=None, **kw):
+        calls.append((method, url, json_body))
+        return {
+            "totalUpdatedCells": 2,
+            "responses": [{"updatedRange": "Sheet1!A1:B1"}, {"spreadsheetId": "s1"}],
+        }
+
+    monkeypatch.setattr(_http, "get_auth", lambda creds_json, scope: object())
+    monkeypatch.setattr(_http, "request", fake_request)
+
+    out = sheets.sheets_values_batch_update(
+        {"spreadsheet_id": "s1", "data": [{"range": "Sheet1!A1:B1", "values": [[1, 2]]}, {"range": "Sheet1!C1", "values": []}]},
+        {"GOOGLE_CREDENTIALS_JSON": "{}"},
+        {},
+    )
+
+    assert out == {"updated_cells": 2, "updated_ranges": ["Sheet1!A1:B1"]}
+    assert calls[0][1].endswith("/spreadsheets/s1/values:batchUpdate")
+    tool = next(t for t in TOOL_DEFS if t.name == "google.sheets.values.batchUpdate")
+    jsonschema.validate(out, tool.output_schema)
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_notion.tools import pages_create, pages_update, databases_query, search
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="notion.pages.create",
         description="Create a Notion page",
@@ -54,6 +55,7 @@ TOOL_DEFS = [
                 "database_id": {"type": "string"},
                 "filter": {"type": "object"},
                 "sorts": {"type": "array"},
+                "max_pages": {"type": "integer", "minimum": 1, "description": "Follow next_cursor for up to this many pages"},
             },
             "required": ["database_id"],
         },
@@ -70,6 +72,7 @@ TOOL_DEFS = [
             "properties": {
                 "query": {"type": "string"},
                 "filter": {"type": "object"},
+                "max_pages": {"type": "integer", "minimum": 1, "description": "Follow next_cursor for up to this many pages"},
             },
         },
         output_schema={"type": "object", "properties": {"results": {"type": "array"}}},
@@ -77,37 +80,13 @@ TOOL_DEFS = [
         auth_slots=["NOTION_TOKEN"],
         risk_class="read",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "notion.pages.create": pages_create,
     "notion.pages.update": pages_update,
     "notion.databases.query": databases_query,
     "notion.search": search,
-}
-
-
-@dataclass
-class NotionPack:
-    name: str = "rig-pack-notion"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = NotionPack()
+})
 
+PACK = make_pack("rig-pack-notion", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
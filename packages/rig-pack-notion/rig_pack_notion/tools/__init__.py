@@ -4,5 +4,10 @@ from .pages import pages_create, pages_update
 from .databases import databases_query
 from .search import search
 
-__all__ = ["pages_create", "pages_update", "databases_query", "search"]
+__all__ = [
+    "pages_create",
+    "pages_update",
+    "databases_query",
+    "search",
+]
 
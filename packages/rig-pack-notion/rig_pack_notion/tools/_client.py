@@ -0,0 +1,82 @@
+"""Shared Notion clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+from weakref import WeakKeyDictionary
+
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+try:
+    from notion_client import AsyncClient
+    from notion_client.errors import HTTPResponseError, RequestTimeoutError
+except ImportError:  # the SDK is only needed once a tool is called
+    AsyncClient = None
+    HTTPResponseError = None
+    RequestTimeoutError = None
+
+# Async clients hold an httpx pool bound to the loop that created them,
+# so they are cached per event loop and token.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_client(token: str) -> Any:
+    """Get a cached notion_client.AsyncClient for a token on the running loop."""
+    if AsyncClient is None:
+        raise RigToolRaised(ToolError(
+            type="internal_error",
+            message="notion-client package not installed. Install with: pip install notion-client",
+            retryable=False,
+        ))
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(token)
+        if client is None:
+            client = clients[token] = AsyncClient(auth=token)
+    return client
+
+
+def upstream_error(e: Exception) -> RigToolRaised:
+    """Map a notion_client error to a typed ToolError."""
+    if isinstance(e, RequestTimeoutError):
+        return RigToolRaised(ToolError(type="timeout", message=str(e), retryable=True))
+    status = e.status
+    return RigToolRaised(ToolError(
+        type="rate_limited" if status == 429 else "upstream_error",
+        message=str(e),
+        upstream_code=str(getattr(e.code, "value", e.code)),
+        retryable=status == 429 or status >= 500,
+    ))
+
+
+async def paginate(
+    fetch: Callable[..., Awaitable[Dict[str, Any]]],
+    max_pages: Optional[int] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield successive responses of a cursor-paginated Notion endpoint.
+
+    The next page is requested as soon as its ``next_cursor`` is known, so
+    its round trip overlaps with the caller consuming the current page.
+    Stops after ``max_pages`` pages if given.
+    """
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch(**kwargs))
+    pages = 0
+    try:
+        while pending is not None:
+            response = await pending
+            pages += 1
+            pending = None
+            cursor = response.get("next_cursor")
+            if response.get("has_more") and cursor and (max_pages is None or pages < max_pages):
+                pending = asyncio.ensure_future(fetch(start_cursor=cursor, **kwargs))
+            yield response
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from rig_core.cache import ttl_cache
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_notion.tools._client import (
+    HTTPResponseError,
+    RequestTimeoutError,
+    get_client,
+    paginate,
+    upstream_error,
+)
 
-def databases_query(
-    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
-) -> Dict[str, Any]:
-    """Query a Notion database."""
-    from notion_client import Client
-    
+
+def _get_notion_client(secrets: Dict[str, str]):
+    """Get authenticated Notion client."""
     token = secrets.get("NOTION_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -22,31 +27,41 @@ def databases_query(
             retryable=False,
         ))
     
+    return get_client(token)
+
+
+@ttl_cache()
+async def databases_query(
+    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
+) -> Dict[str, Any]:
+    """Query a Notion database.
+    
+    Follows ``next_cursor`` for up to ``max_pages`` pages (default 1).
+    """
+    notion = _get_notion_client(secrets)
+    
     try:
-        notion = Client(auth=token)
-        
-        response = notion.databases.query(
-            database_id=args["database_id"],
-            filter=args.get("filter"),
-            sorts=args.get("sorts"),
-            page_size=args.get("page_size", 100),
-        )
-        
         results = []
-        for page in response.get("results", []):
-            results.append({
-                "id": page["id"],
-                "properties": page.get("properties", {}),
-            })
+        has_more = False
+        async for response in paginate(notion.databases.query, args.get("max_pages", 1), **_query_kwargs(args)):
+            results += [
+                {"id": page["id"], "properties": page.get("properties", {})}
+                for page in response.get("results", [])
+            ]
+            has_more = response.get("has_more", False)
         
         return {
             "results": results,
-            "has_more": response.get("has_more", False),
+            "has_more": has_more,
         }
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except (HTTPResponseError, RequestTimeoutError) as e:
+        raise upstream_error(e)
+
 
+def _query_kwargs(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "database_id": args["database_id"],
+        "filter": args.get("filter"),
+        "sorts": args.get("sorts"),
+        "page_size": args.get("page_size", 100),
+    }
@@ -7,11 +7,16 @@ from typing import Any, Dict
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_notion.tools._client import (
+    HTTPResponseError,
+    RequestTimeoutError,
+    get_client,
+    upstream_error,
+)
+
 
 def _get_notion_client(secrets: Dict[str, str]):
     """Get authenticated Notion client."""
-    from notion_client import Client
-    
     token = secrets.get("NOTION_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -20,17 +25,17 @@ def _get_notion_client(secrets: Dict[str, str]):
             retryable=False,
         ))
     
-    return Client(auth=token)
+    return get_client(token)
 
 
-def pages_create(
+async def pages_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a Notion page."""
+    notion = _get_notion_client(secrets)
+    
     try:
-        notion = _get_notion_client(secrets)
-        
-        page = notion.pages.create(
+        page = await notion.pages.create(
             parent=args["parent"],
             properties=args.get("properties", {}),
             children=args.get("children", []),
@@ -40,22 +45,18 @@ def pages_create(
             "id": page["id"],
             "url": page.get("url"),
         }
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except (HTTPResponseError, RequestTimeoutError) as e:
+        raise upstream_error(e)
 
 
-def pages_update(
+async def pages_update(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Update a Notion page."""
+    notion = _get_notion_client(secrets)
+    
     try:
-        notion = _get_notion_client(secrets)
-        
-        page = notion.pages.update(
+        page = await notion.pages.update(
             page_id=args["page_id"],
             properties=args.get("properties", {}),
         )
@@ -64,10 +65,6 @@ def pages_update(
             "id": page["id"],
             "url": page.get("url"),
         }
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except (HTTPResponseError, RequestTimeoutError) as e:
+        raise upstream_error(e)
 
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
+from rig_core.cache import ttl_cache
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_notion.tools._client import (
+    HTTPResponseError,
+    RequestTimeoutError,
+    get_client,
+    paginate,
+    upstream_error,
+)
 
-def search(
-    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
-) -> Dict[str, Any]:
-    """Search Notion."""
-    from notion_client import Client
-    
+
+def _get_notion_client(secrets: Dict[str, str]):
+    """Get authenticated Notion client."""
     token = secrets.get("NOTION_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -22,44 +29,96 @@ def search(
             retryable=False,
         ))
     
+    return get_client(token)
+
+
+@ttl_cache()
+async def search(
+    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
+) -> Dict[str, Any]:
+    """Search Notion.
+    
+    Follows ``next_cursor`` for up to ``max_pages`` pages (default 1).
+    """
+    notion = _get_notion_client(secrets)
+    
     try:
-        notion = Client(auth=token)
-        
-        response = notion.search(
-            query=args.get("query", ""),
-            filter=args.get("filter"),
-            page_size=args.get("page_size", 20),
-        )
-        
         results = []
-        for item in response.get("results", []):
-            results.append({
-                "id": item["id"],
-                "object": item["object"],
-                "title": _extract_title(item),
-            })
+        async for response in paginate(notion.search, args.get("max_pages", 1), **_search_kwargs(args)):
+            results += [
+                {"id": item["id"], "object": item["object"], "title": _extract_title(item)}
+                for item in response.get("results", [])
+            ]
         
         return {"results": results}
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except (HTTPResponseError, RequestTimeoutError) as e:
+        raise upstream_error(e)
+
+
+def _search_kwargs(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "query": args.get("query", ""),
+        "filter": args.get("filter"),
+        "page_size": args.get("page_size", 20),
+    }
+
+
+# Title property name per parent database; every page in a database
+# shares it, so only the first page of each database needs a scan.
+_title_keys: Dict[str, str] = {}
+_TITLE_KEYS_MAX = 1024
+
+
+def _title_key(item: Dict[str, Any], props: Dict[str, Any]) -> Optional[str]:
+    """Find the name of a page's title property."""
+    database_id = (item.get("parent") or {}).get("database_id")
+    key = _title_keys.get(database_id) if database_id else None
+    if key in props:
+        return key
+    
+    key = next((name for name, prop in props.items() if prop.get("type") == "title"), None)
+    if key is not None and database_id:
+        if len(_title_keys) >= _TITLE_KEYS_MAX:
+            _title_keys.clear()
+        _title_keys[database_id] = key
+    return key
+
+
+# Extracted titles keyed by (id, last_edited_time): results repeat across
+# cursors and re-paginations, and an edit produces a fresh key.
+_titles: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_TITLES_MAX = 4096
+_titles_lock = threading.Lock()
 
 
 def _extract_title(item: Dict[str, Any]) -> str:
+    """Extract title from Notion item, memoized per item revision."""
+    key = (item["id"], item.get("last_edited_time", ""))
+    with _titles_lock:
+        title = _titles.get(key)
+        if title is not None:
+            _titles.move_to_end(key)
+            return title
+    
+    title = _scan_title(item)
+    with _titles_lock:
+        _titles[key] = title
+        if len(_titles) > _TITLES_MAX:
+            _titles.popitem(last=False)
+    return title
+
+
+def _scan_title(item: Dict[str, Any]) -> str:
     """Extract title from Notion item."""
     if item["object"] == "page":
         props = item.get("properties", {})
-        for prop in props.values():
-            if prop.get("type") == "title":
-                title_arr = prop.get("title", [])
-                if title_arr:
-                    return title_arr[0].get("plain_text", "")
+        key = _title_key(item, props)
+        if key is not None:
+            title_arr = props[key].get("title", [])
+            if title_arr:
+                return title_arr[0].get("plain_text", "")
     elif item["object"] == "database":
         title_arr = item.get("title", [])
         if title_arr:
             return title_arr[0].get("plain_text", "")
     return ""
-
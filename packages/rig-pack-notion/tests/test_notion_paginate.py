@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from rig_pack_notion.tools._client import paginate
+
+
+def _endpoint(total_pages: int):
+    """A fake cursor-paginated endpoint; records each start_cursor requested."""
+    requested: List[Optional[str]] = []
+
+    async def fetch(start_cursor: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
+        requested.append(start_cursor)
+        page = int(start_cursor or 0)
+        more = page + 1 < total_pages
+        return {"results": [page], "has_more": more, "next_cursor": str(page + 1) if more else None}
+
+    return fetch, requested
+
+
+def test_paginate_prefetches_the_next_page() -> None:
+    fetch, requested = _endpoint(3)
+
+    async def run():
+        seen = []
+        async for response in paginate(fetch):
+            # Let the prefetch run before this page is handed back
+            await asyncio.sleep(0)
+            seen.append((response["results"], len(requested)))
+        return seen
+
+    # Page 1's request is in flight while page 0 is being consumed
+    assert asyncio.run(run()) == [([0], 2), ([1], 3), ([2], 3)]
+    assert requested == [None, "1", "2"]
+
+
+def test_paginate_stops_at_max_pages() -> None:
+    fetch, requested = _endpoint(5)
+
+    async def run():
+        return [response["results"] async for response in paginate(fetch, max_pages=2)]
+
+    assert asyncio.run(run()) == [[0], [1]]
+    assert requested == [None, "1"]
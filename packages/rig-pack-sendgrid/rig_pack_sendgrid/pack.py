@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_sendgrid.tools import email_send, templates_list
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="sendgrid.email.send",
         description="Send an email via SendGrid",
@@ -51,35 +52,11 @@ TOOL_DEFS = [
         auth_slots=["SENDGRID_API_KEY"],
         risk_class="read",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "sendgrid.email.send": email_send,
     "sendgrid.templates.list": templates_list,
-}
-
-
-@dataclass
-class SendGridPack:
-    name: str = "rig-pack-sendgrid"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = SendGridPack()
+})
 
+PACK = make_pack("rig-pack-sendgrid", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
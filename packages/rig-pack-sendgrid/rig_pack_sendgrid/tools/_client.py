@@ -0,0 +1,55 @@
+"""Shared SendGrid clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Dict
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+SENDGRID_API = "https://api.sendgrid.com/v3"
+
+# httpx.AsyncClient pools are bound to the loop that created them, so
+# clients are cached per event loop and API key.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_client(api_key: str) -> httpx.AsyncClient:
+    """Get a cached SendGrid v3 REST client for an API key on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = httpx.AsyncClient(
+                base_url=SENDGRID_API,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+    return client
+
+
+def upstream_error(e: httpx.HTTPError) -> RigToolRaised:
+    """Map a failed SendGrid request to a typed ToolError.
+
+    Failures without a response are not retryable: SendGrid may already
+    have accepted a message whose reply was lost.
+    """
+    if isinstance(e, httpx.TimeoutException):
+        return RigToolRaised(ToolError(type="timeout", message=str(e) or "SendGrid request timed out", retryable=False))
+    if not isinstance(e, httpx.HTTPStatusError):
+        return RigToolRaised(ToolError(type="upstream_error", message=str(e) or type(e).__name__, retryable=False))
+    status = e.response.status_code
+    return RigToolRaised(ToolError(
+        type="rate_limited" if status == 429 else "upstream_error",
+        message=str(e),
+        upstream_code=str(status),
+        retryable=status == 429 or status >= 500,
+    ))
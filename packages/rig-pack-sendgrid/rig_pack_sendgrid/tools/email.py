@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from email.utils import parseaddr
+from typing import Any, Dict, Optional
+
+import httpx
 
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_sendgrid.tools._client import get_client, upstream_error
+
+
+def _address(value: str) -> Dict[str, str]:
+    """Convert "addr" or "Name <addr>" to a v3 API email object."""
+    name, addr = parseaddr(value)
+    if name:
+        return {"email": addr, "name": name}
+    return {"email": addr or value}
+
+
+def _build_mail_json(
+    from_email: str, to: str, subject: str, html: Optional[str], text: Optional[str]
+) -> Dict[str, Any]:
+    """Build the /v3/mail/send request body."""
+    content = []
+    # The v3 API requires text/plain to come before text/html
+    if text is not None:
+        content.append({"type": "text/plain", "value": text})
+    if html is not None:
+        content.append({"type": "text/html", "value": html})
+    
+    body: Dict[str, Any] = {
+        "personalizations": [{"to": [_address(to)]}],
+        "from": _address(from_email),
+        "subject": subject,
+    }
+    if content:
+        body["content"] = content
+    return body
 
-def email_send(
+
+async def email_send(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Send an email via SendGrid.
@@ -21,9 +55,6 @@ def email_send(
     Returns:
         Status code and message ID
     """
-    from sendgrid import SendGridAPIClient
-    from sendgrid.helpers.mail import Mail
-    
     api_key = secrets.get("SENDGRID_API_KEY")
     if not api_key:
         raise RigToolRaised(ToolError(
@@ -32,26 +63,24 @@ def email_send(
             retryable=False,
         ))
     
+    sg = get_client(api_key)
+    
     try:
-        message = Mail(
+        body = _build_mail_json(
             from_email=args["from_email"],
-            to_emails=args["to"],
+            to=args["to"],
             subject=args["subject"],
-            html_content=args.get("html_content"),
-            plain_text_content=args.get("text_content"),
+            html=args.get("html_content"),
+            text=args.get("text_content"),
         )
         
-        sg = SendGridAPIClient(api_key)
-        response = sg.send(message)
+        response = await sg.post("/mail/send", json=body)
+        response.raise_for_status()
         
         return {
             "status_code": response.status_code,
             "message_id": response.headers.get("X-Message-Id"),
         }
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
 
@@ -4,11 +4,18 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import httpx
+
+from rig_core import jsonutil
+from rig_core.cache import ttl_cache
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_sendgrid.tools._client import get_client, upstream_error
+
 
-def templates_list(
+@ttl_cache()
+async def templates_list(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """List SendGrid email templates.
@@ -21,8 +28,6 @@ def templates_list(
     Returns:
         List of templates
     """
-    from sendgrid import SendGridAPIClient
-    
     api_key = secrets.get("SENDGRID_API_KEY")
     if not api_key:
         raise RigToolRaised(ToolError(
@@ -31,28 +36,25 @@ def templates_list(
             retryable=False,
         ))
     
+    sg = get_client(api_key)
+    
     try:
-        sg = SendGridAPIClient(api_key)
-        
         params = {"generations": args.get("generations", "dynamic")}
-        response = sg.client.templates.get(query_params=params)
+        response = await sg.get("/templates", params=params)
+        response.raise_for_status()
         
-        import json
-        data = json.loads(response.body)
+        data = jsonutil.loads(response.content)
         
-        templates = []
-        for t in data.get("templates", []):
-            templates.append({
+        templates = [
+            {
                 "id": t["id"],
                 "name": t["name"],
                 "generation": t.get("generation"),
-            })
+            }
+            for t in data.get("templates", [])
+        ]
         
         return {"templates": templates}
-    except Exception as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            retryable=False,
-        ))
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
 
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from rig_core.policy import Policy
+from rig_core.runtime import RigRuntime
+from rig_core.secrets import SecretsStore
+from rig_pack_sendgrid.pack import PACK
+from rig_pack_sendgrid.tools import _client
+
+
+def test_email_send_timeout_is_not_retried(monkeypatch) -> None:
+    monkeypatch.setenv("SENDGRID_API_KEY", "SG.key")
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    runtime = RigRuntime(policy=Policy(), secrets=SecretsStore(), audit=None)
+    runtime.register("sendgrid.email.send", PACK.rig_impls()["sendgrid.email.send"])
+
+    async def run():
+        _client._clients[asyncio.get_running_loop()] = {
+            "SG.key": httpx.AsyncClient(base_url=_client.SENDGRID_API, transport=httpx.MockTransport(handler)),
+        }
+        return await runtime.acall(
+            "sendgrid.email.send",
+            {"to": "a@example.com", "from_email": "b@example.com", "subject": "hi", "text_content": "hi"},
+            {},
+        )
+
+    result = asyncio.run(run())
+
+    assert len(sent) == 1
+    assert result.ok is False
+    assert result.error.type == "timeout"
+    assert result.error.retryable is False
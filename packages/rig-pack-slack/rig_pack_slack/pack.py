@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_slack.tools import (
     messages_post, messages_update, channels_list, users_lookup_by_email
 )
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="slack.messages.post",
         description="Post a message to a Slack channel",
@@ -91,37 +92,13 @@ TOOL_DEFS = [
         auth_slots=["SLACK_BOT_TOKEN"],
         risk_class="read",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "slack.messages.post": messages_post,
     "slack.messages.update": messages_update,
     "slack.channels.list": channels_list,
     "slack.users.lookupByEmail": users_lookup_by_email,
-}
-
-
-@dataclass
-class SlackPack:
-    name: str = "rig-pack-slack"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = SlackPack()
+})
 
+PACK = make_pack("rig-pack-slack", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
@@ -0,0 +1,69 @@
+"""Shared Slack clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, Tuple
+from weakref import WeakKeyDictionary
+
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+try:
+    from aiohttp import ClientSession, TCPConnector
+    from slack_sdk.errors import SlackApiError
+    from slack_sdk.web.async_client import AsyncWebClient
+except ImportError:  # the SDK is only needed once a tool is called
+    AsyncWebClient = None
+    SlackApiError = None
+
+# An aiohttp session is bound to the loop that created it, so each event
+# loop gets one pooled session shared by that loop's per-token clients.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Any, Dict[str, Any]]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+# Slack error codes worth retrying
+RETRYABLE_ERRORS = frozenset({"ratelimited", "service_unavailable", "fatal_error"})
+
+
+def get_client(token: str) -> Any:
+    """Get a cached slack_sdk AsyncWebClient for a token on the running loop."""
+    if AsyncWebClient is None:
+        raise RigToolRaised(ToolError(
+            type="internal_error",
+            message="slack-sdk and aiohttp packages not installed. Install with: pip install slack-sdk aiohttp",
+            retryable=False,
+        ))
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        entry = _clients.get(loop)
+        if entry is None:
+            session = ClientSession(connector=TCPConnector(limit=100, limit_per_host=20))
+            entry = _clients[loop] = (session, {})
+        session, clients = entry
+        client = clients.get(token)
+        if client is None:
+            client = clients[token] = AsyncWebClient(token=token, session=session)
+    return client
+
+
+def upstream_error(e: Exception) -> RigToolRaised:
+    """Map a SlackApiError to a typed ToolError."""
+    code = e.response["error"]
+    retry_after = None
+    if code == "ratelimited":
+        headers = e.response.headers or {}
+        value = headers.get("Retry-After", headers.get("retry-after"))
+        try:
+            retry_after = float(value) if value is not None else None
+        except ValueError:
+            retry_after = None
+    return RigToolRaised(ToolError(
+        type="rate_limited" if code == "ratelimited" else "upstream_error",
+        message=str(code),
+        upstream_code=code,
+        retryable=code in RETRYABLE_ERRORS,
+        retry_after_seconds=retry_after,
+    ))
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from rig_core.cache import ttl_cache
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_slack.tools._client import SlackApiError, get_client, upstream_error
 
-def channels_list(
+
+@ttl_cache()
+async def channels_list(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """List Slack channels.
@@ -21,9 +25,6 @@ def channels_list(
     Returns:
         List of channels
     """
-    from slack_sdk import WebClient
-    from slack_sdk.errors import SlackApiError
-    
     token = secrets.get("SLACK_BOT_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -32,31 +33,27 @@ def channels_list(
             retryable=False,
         ))
     
+    client = get_client(token)
+    
     try:
-        client = WebClient(token=token)
-        
-        response = client.conversations_list(
+        response = await client.conversations_list(
             types=args.get("types", "public_channel"),
             limit=args.get("limit", 100),
         )
         
-        channels = []
-        for ch in response["channels"]:
-            channels.append({
+        channels = [
+            {
                 "id": ch["id"],
                 "name": ch["name"],
                 "is_private": ch.get("is_private", False),
-            })
+            }
+            for ch in response["channels"]
+        ]
         
         return {
             "ok": response["ok"],
             "channels": channels,
         }
     except SlackApiError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e.response["error"]),
-            upstream_code=e.response["error"],
-            retryable=e.response["error"] in ["ratelimited"],
-        ))
+        raise upstream_error(e)
 
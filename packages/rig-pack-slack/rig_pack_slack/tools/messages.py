@@ -7,8 +7,10 @@ from typing import Any, Dict
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_slack.tools._client import SlackApiError, get_client, upstream_error
 
-def messages_post(
+
+async def messages_post(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Post a message to a Slack channel.
@@ -21,9 +23,6 @@ def messages_post(
     Returns:
         Message ts and channel
     """
-    from slack_sdk import WebClient
-    from slack_sdk.errors import SlackApiError
-    
     token = secrets.get("SLACK_BOT_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -32,10 +31,10 @@ def messages_post(
             retryable=False,
         ))
     
+    client = get_client(token)
+    
     try:
-        client = WebClient(token=token)
-        
-        response = client.chat_postMessage(
+        response = await client.chat_postMessage(
             channel=args["channel"],
             text=args["text"],
             blocks=args.get("blocks"),
@@ -48,15 +47,10 @@ def messages_post(
             "channel": response["channel"],
         }
     except SlackApiError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e.response["error"]),
-            upstream_code=e.response["error"],
-            retryable=e.response["error"] in ["ratelimited"],
-        ))
+        raise upstream_error(e)
 
 
-def messages_update(
+async def messages_update(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Update a Slack message.
@@ -69,9 +63,6 @@ def messages_update(
     Returns:
         Updated message ts
     """
-    from slack_sdk import WebClient
-    from slack_sdk.errors import SlackApiError
-    
     token = secrets.get("SLACK_BOT_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -80,10 +71,10 @@ def messages_update(
             retryable=False,
         ))
     
+    client = get_client(token)
+    
     try:
-        client = WebClient(token=token)
-        
-        response = client.chat_update(
+        response = await client.chat_update(
             channel=args["channel"],
             ts=args["ts"],
             text=args["text"],
@@ -96,10 +87,5 @@ def messages_update(
             "channel": response["channel"],
         }
     except SlackApiError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e.response["error"]),
-            upstream_code=e.response["error"],
-            retryable=False,
-        ))
+        raise upstream_error(e)
 
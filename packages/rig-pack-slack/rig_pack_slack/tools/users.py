@@ -4,11 +4,15 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from rig_core.cache import ttl_cache
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_slack.tools._client import SlackApiError, get_client, upstream_error
 
-def users_lookup_by_email(
+
+@ttl_cache(ttl=600)
+async def users_lookup_by_email(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Look up a Slack user by email.
@@ -21,9 +25,6 @@ def users_lookup_by_email(
     Returns:
         User info
     """
-    from slack_sdk import WebClient
-    from slack_sdk.errors import SlackApiError
-    
     token = secrets.get("SLACK_BOT_TOKEN")
     if not token:
         raise RigToolRaised(ToolError(
@@ -32,10 +33,10 @@ def users_lookup_by_email(
             retryable=False,
         ))
     
+    client = get_client(token)
+    
     try:
-        client = WebClient(token=token)
-        
-        response = client.users_lookupByEmail(email=args["email"])
+        response = await client.users_lookupByEmail(email=args["email"])
         
         user = response["user"]
         return {
@@ -48,10 +49,5 @@ def users_lookup_by_email(
             },
         }
     except SlackApiError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e.response["error"]),
-            upstream_code=e.response["error"],
-            retryable=False,
-        ))
+        raise upstream_error(e)
 
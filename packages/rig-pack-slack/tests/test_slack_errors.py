@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+from rig_pack_slack.tools._client import upstream_error
+
+
+def _api_error(error: str, status: int, headers: dict) -> SlackApiError:
+    response = SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://slack.com/api/chat.postMessage",
+        req_args={},
+        data={"ok": False, "error": error},
+        headers=headers,
+        status_code=status,
+    )
+    return SlackApiError(error, response)
+
+
+def test_ratelimited_maps_to_rate_limited_with_retry_after() -> None:
+    err = upstream_error(_api_error("ratelimited", 429, {"Retry-After": "30"})).err
+
+    assert err.type == "rate_limited"
+    assert err.retryable is True
+    assert err.retry_after_seconds == 30.0
+    assert err.upstream_code == "ratelimited"
+
+
+def test_other_errors_stay_upstream_errors() -> None:
+    err = upstream_error(_api_error("channel_not_found", 200, {})).err
+
+    assert err.type == "upstream_error"
+    assert err.retryable is False
+    assert err.retry_after_seconds is None
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_stripe.tools import (
     customers_create, customers_search,
@@ -16,7 +17,7 @@ from rig_pack_stripe.tools import (
 )
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="stripe.customers.create",
         description="Create a new Stripe customer",
@@ -27,6 +28,7 @@ TOOL_DEFS = [
                 "name": {"type": "string", "description": "Customer name"},
                 "phone": {"type": "string", "description": "Customer phone"},
                 "metadata": {"type": "object", "description": "Additional metadata"},
+                "expand": {"type": "array", "items": {"type": "string"}, "description": "Related objects to return inline (e.g., ['invoice_settings.default_payment_method'])"},
             },
             "required": ["email"],
         },
@@ -73,6 +75,7 @@ TOOL_DEFS = [
                 "customer_id": {"type": "string", "description": "Customer ID"},
                 "collection_method": {"type": "string", "enum": ["charge_automatically", "send_invoice"]},
                 "days_until_due": {"type": "integer", "description": "Days until due"},
+                "expand": {"type": "array", "items": {"type": "string"}, "description": "Related objects to return inline (e.g., ['customer'])"},
             },
             "required": ["customer_id"],
         },
@@ -140,6 +143,7 @@ TOOL_DEFS = [
                 "charge": {"type": "string", "description": "Charge ID (alternative to payment_intent)"},
                 "amount": {"type": "integer", "description": "Amount to refund (optional, full refund if omitted)"},
             },
+            "anyOf": [{"required": ["payment_intent"]}, {"required": ["charge"]}],
         },
         output_schema={
             "type": "object",
@@ -158,6 +162,7 @@ TOOL_DEFS = [
                 "customer_id": {"type": "string", "description": "Customer ID"},
                 "price_id": {"type": "string", "description": "Price ID"},
                 "trial_days": {"type": "integer", "description": "Trial period in days"},
+                "expand": {"type": "array", "items": {"type": "string"}, "description": "Related objects to return inline (e.g., ['latest_invoice'])"},
             },
             "required": ["customer_id", "price_id"],
         },
@@ -187,10 +192,10 @@ TOOL_DEFS = [
         auth_slots=["STRIPE_API_KEY"],
         risk_class="money",
     ),
-]
+)
 
 # Map tool names to implementations
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "stripe.customers.create": customers_create,
     "stripe.customers.search": customers_search,
     "stripe.invoices.create": invoices_create,
@@ -199,32 +204,6 @@ TOOL_IMPLS = {
     "stripe.refunds.create": refunds_create,
     "stripe.subscriptions.create": subscriptions_create,
     "stripe.subscriptions.cancel": subscriptions_cancel,
-}
-
-
-@dataclass
-class StripePack:
-    name: str = "rig-pack-stripe"
-    version: str = "0.1.0"
-
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool,
-                    impl=TOOL_IMPLS[tool.name],
-                    pack=self.name,
-                    pack_version=self.version,
-                )
-        return result
-
-
-PACK = StripePack()
+})
 
+PACK = make_pack("rig-pack-stripe", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
@@ -0,0 +1,73 @@
+"""Shared Stripe clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, Iterable
+from weakref import WeakKeyDictionary
+
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+try:
+    import stripe
+except ImportError:  # the SDK is only needed once a tool is called
+    stripe = None
+
+# StripeClient's async transport is an httpx.AsyncClient, whose pool is
+# bound to the loop that first used it, so clients are cached per event
+# loop and API key.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_client(secrets: Dict[str, str]) -> Any:
+    """Get a cached StripeClient for the caller's API key on the running loop.
+
+    Each client carries its own key and HTTP session, so concurrent calls
+    for different tenants never race on the module-global ``stripe.api_key``.
+    """
+    api_key = secrets.get("STRIPE_API_KEY")
+    if not api_key:
+        raise RigToolRaised(ToolError(
+            type="auth_error",
+            message="STRIPE_API_KEY not configured",
+            retryable=False,
+        ))
+
+    if stripe is None:
+        raise RigToolRaised(ToolError(
+            type="internal_error",
+            message="stripe package not installed. Install with: pip install stripe",
+            retryable=False,
+        ))
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = stripe.StripeClient(api_key, http_client=stripe.HTTPXClient())
+    return client
+
+
+def upstream_error(e: Exception) -> RigToolRaised:
+    """Map a StripeError to a typed ToolError by its HTTP status."""
+    status = e.http_status
+    if status is None:
+        # No response (connection failure or timeout): Stripe may still have
+        # processed the request, and no tool sends an idempotency key, so a
+        # retry could charge or refund twice
+        return RigToolRaised(ToolError(type="upstream_error", message=str(e), retryable=False))
+    return RigToolRaised(ToolError(
+        type="rate_limited" if status == 429 else "upstream_error",
+        message=str(e),
+        upstream_code=e.code,
+        retryable=status == 429 or status >= 500,
+    ))
+
+
+def expanded_fields(obj: Any, expand: Iterable[str]) -> Dict[str, Any]:
+    """Pick the top-level fields of a Stripe object named by ``expand`` paths."""
+    return {name: obj.get(name) for name in {path.split(".", 1)[0] for path in expand}}
@@ -4,58 +4,55 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+from rig_core.cache import ttl_cache
+from rig_core.rtp import CallContext
 
+from rig_pack_stripe.tools._client import expanded_fields, get_client, stripe, upstream_error
 
-def customers_create(
+
+async def customers_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a new Stripe customer.
     
     Args:
-        args: Input with email, name, phone, metadata
+        args: Input with email, name, phone, metadata, optional expand
         secrets: Must contain STRIPE_API_KEY
         ctx: Call context
         
     Returns:
-        Customer id, email, name
+        Customer id, email, name, plus any expanded fields
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        customer = stripe.Customer.create(
-            email=args.get("email"),
-            name=args.get("name"),
-            phone=args.get("phone"),
-            metadata=args.get("metadata") or {},
-        )
+        params = {
+            "email": args.get("email"),
+            "name": args.get("name"),
+            "phone": args.get("phone"),
+            "metadata": args.get("metadata") or {},
+        }
+        expand = args.get("expand")
+        if expand:
+            params["expand"] = expand
         
-        return {
+        customer = await client.customers.create_async(params=params)
+        
+        out = {
             "id": customer.id,
             "email": customer.email,
             "name": customer.name,
         }
+        if expand:
+            out.update(expanded_fields(customer, expand))
+        return out
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
 
-def customers_search(
+# Stripe search is eventually consistent anyway; repeats within a plan reuse the result
+@ttl_cache(ttl=10.0)
+async def customers_search(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Search for Stripe customers.
@@ -68,35 +65,13 @@ def customers_search(
     Returns:
         List of matching customers
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        result = stripe.Customer.search(query=args["query"])
+        result = await client.customers.search_async(params={"query": args["query"]})
         
-        customers = []
-        for c in result.data:
-            customers.append({
-                "id": c.id,
-                "email": c.email,
-                "name": c.name,
-            })
+        customers = [{"id": c.id, "email": c.email, "name": c.name} for c in result.data]
         
         return {"customers": customers, "has_more": result.has_more}
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
-
+        raise upstream_error(e)
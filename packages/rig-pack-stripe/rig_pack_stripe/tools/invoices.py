@@ -4,59 +4,53 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+from rig_core.rtp import CallContext
 
+from rig_pack_stripe.tools._client import expanded_fields, get_client, stripe, upstream_error
 
-def invoices_create(
+
+async def invoices_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a new Stripe invoice.
     
     Args:
-        args: Input with customer_id, collection_method, days_until_due
+        args: Input with customer_id, collection_method, days_until_due, optional expand
         secrets: Must contain STRIPE_API_KEY
         ctx: Call context
         
     Returns:
-        Invoice id and status
+        Invoice id and status, plus any expanded fields
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        invoice = stripe.Invoice.create(
-            customer=args["customer_id"],
-            collection_method=args.get("collection_method", "charge_automatically"),
-            days_until_due=args.get("days_until_due"),
-            auto_advance=args.get("auto_advance", True),
-        )
+        params = {
+            "customer": args["customer_id"],
+            "collection_method": args.get("collection_method", "charge_automatically"),
+            "days_until_due": args.get("days_until_due"),
+            "auto_advance": args.get("auto_advance", True),
+        }
+        expand = args.get("expand")
+        if expand:
+            params["expand"] = expand
         
-        return {
+        invoice = await client.invoices.create_async(params=params)
+        
+        out = {
             "id": invoice.id,
             "status": invoice.status,
             "total": invoice.total,
             "currency": invoice.currency,
         }
+        if expand:
+            out.update(expanded_fields(invoice, expand))
+        return out
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
 
-def invoice_items_create(
+async def invoice_items_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Add an item to a Stripe invoice.
@@ -69,26 +63,16 @@ def invoice_items_create(
     Returns:
         Invoice item id
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        item = stripe.InvoiceItem.create(
-            customer=args["customer_id"],
-            amount=args["amount"],
-            currency=args.get("currency", "usd"),
-            description=args.get("description"),
-            invoice=args.get("invoice_id"),
-        )
+        item = await client.invoice_items.create_async(params={
+            "customer": args["customer_id"],
+            "amount": args["amount"],
+            "currency": args.get("currency", "usd"),
+            "description": args.get("description"),
+            "invoice": args.get("invoice_id"),
+        })
         
         return {
             "id": item.id,
@@ -96,10 +80,4 @@ def invoice_items_create(
             "currency": item.currency,
         }
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
-
+        raise upstream_error(e)
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+from rig_core.rtp import CallContext
 
+from rig_pack_stripe.tools._client import get_client, stripe, upstream_error
 
-def payment_links_create(
+
+async def payment_links_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a Stripe payment link.
@@ -21,23 +22,13 @@ def payment_links_create(
     Returns:
         Payment link url and id
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        link = stripe.PaymentLink.create(
-            line_items=args["line_items"],
-            metadata=args.get("metadata") or {},
-        )
+        link = await client.payment_links.create_async(params={
+            "line_items": args["line_items"],
+            "metadata": args.get("metadata") or {},
+        })
         
         return {
             "id": link.id,
@@ -45,15 +36,10 @@ def payment_links_create(
             "active": link.active,
         }
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
 
-def refunds_create(
+async def refunds_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a Stripe refund.
@@ -66,36 +52,19 @@ def refunds_create(
     Returns:
         Refund id and status
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        refund_params = {}
-        
+        # The input schema requires one of the two; payment_intent wins if both are given
         if "payment_intent" in args:
-            refund_params["payment_intent"] = args["payment_intent"]
-        elif "charge" in args:
-            refund_params["charge"] = args["charge"]
+            refund_params = {"payment_intent": args["payment_intent"]}
         else:
-            raise RigToolRaised(ToolError(
-                type="validation_error",
-                message="Either payment_intent or charge is required",
-                retryable=False,
-            ))
+            refund_params = {"charge": args["charge"]}
         
         if "amount" in args:
             refund_params["amount"] = args["amount"]
         
-        refund = stripe.Refund.create(**refund_params)
+        refund = await client.refunds.create_async(params=refund_params)
         
         return {
             "id": refund.id,
@@ -104,10 +73,5 @@ def refunds_create(
             "currency": refund.currency,
         }
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
@@ -4,34 +4,25 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+from rig_core.rtp import CallContext
 
+from rig_pack_stripe.tools._client import expanded_fields, get_client, stripe, upstream_error
 
-def subscriptions_create(
+
+async def subscriptions_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a Stripe subscription.
     
     Args:
-        args: Input with customer_id, price_id, optional trial_days
+        args: Input with customer_id, price_id, optional trial_days and expand
         secrets: Must contain STRIPE_API_KEY
         ctx: Call context
         
     Returns:
-        Subscription id and status
+        Subscription id and status, plus any expanded fields
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
         sub_params = {
@@ -42,23 +33,25 @@ def subscriptions_create(
         if args.get("trial_days"):
             sub_params["trial_period_days"] = args["trial_days"]
         
-        subscription = stripe.Subscription.create(**sub_params)
+        expand = args.get("expand")
+        if expand:
+            sub_params["expand"] = expand
         
-        return {
+        subscription = await client.subscriptions.create_async(params=sub_params)
+        
+        out = {
             "id": subscription.id,
             "status": subscription.status,
             "current_period_end": subscription.current_period_end,
         }
+        if expand:
+            out.update(expanded_fields(subscription, expand))
+        return out
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
 
-def subscriptions_cancel(
+async def subscriptions_cancel(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Cancel a Stripe subscription.
@@ -71,30 +64,15 @@ def subscriptions_cancel(
     Returns:
         Subscription id and status
     """
-    import stripe
-    
-    api_key = secrets.get("STRIPE_API_KEY")
-    if not api_key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="STRIPE_API_KEY not configured",
-            retryable=False,
-        ))
-    
-    stripe.api_key = api_key
+    client = get_client(secrets)
     
     try:
-        subscription = stripe.Subscription.cancel(args["subscription_id"])
+        subscription = await client.subscriptions.cancel_async(args["subscription_id"])
         
         return {
             "id": subscription.id,
             "status": subscription.status,
         }
     except stripe.StripeError as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=getattr(e, "code", None),
-            retryable=getattr(e, "should_retry", False),
-        ))
+        raise upstream_error(e)
 
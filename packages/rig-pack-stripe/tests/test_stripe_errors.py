@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from rig_pack_stripe.tools._client import upstream_error
+
+
+class FakeStripeError(Exception):
+    """Carries the attributes upstream_error reads from a stripe.StripeError."""
+
+    def __init__(self, message: str, http_status=None, code=None) -> None:
+        super().__init__(message)
+        self.http_status = http_status
+        self.code = code
+
+
+def test_error_without_a_response_is_not_retryable() -> None:
+    err = upstream_error(FakeStripeError("Network error: read timed out")).err
+
+    assert err.type == "upstream_error"
+    assert err.retryable is False
+
+
+def test_server_and_rate_limit_errors_stay_retryable() -> None:
+    assert upstream_error(FakeStripeError("busy", 429, "rate_limit")).err.type == "rate_limited"
+    assert upstream_error(FakeStripeError("oops", 500)).err.retryable is True
+    assert upstream_error(FakeStripeError("declined", 402, "card_declined")).err.retryable is False
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
-from rig_pack_supabase.tools import table_select, table_insert, table_update, auth_create_user
+from rig_pack_supabase.tools import table_select, table_insert, table_bulk_insert, table_update, auth_create_user
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="supabase.table.select",
         description="Select from a Supabase table",
@@ -37,7 +38,11 @@ TOOL_DEFS = [
             "type": "object",
             "properties": {
                 "table": {"type": "string"},
-                "data": {"type": "object"},
+                "data": {
+                    "type": ["object", "array"],
+                    "items": {"type": "object"},
+                    "description": "A row, or a list of rows inserted in one request",
+                },
             },
             "required": ["table", "data"],
         },
@@ -46,6 +51,23 @@ TOOL_DEFS = [
         auth_slots=["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"],
         risk_class="write",
     ),
+    ToolDef(
+        name="supabase.table.bulkInsert",
+        description="Insert many rows into a Supabase table in batches (each batch is its own transaction)",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "table": {"type": "string"},
+                "rows": {"type": "array", "items": {"type": "object"}},
+                "batch_size": {"type": "integer", "minimum": 1, "maximum": 1000, "default": 500},
+            },
+            "required": ["table", "rows"],
+        },
+        output_schema={"type": "object", "properties": {"data": {"type": "array"}}},
+        error_schema={"type": "object"},
+        auth_slots=["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"],
+        risk_class="write",
+    ),
     ToolDef(
         name="supabase.table.update",
         description="Update rows in a Supabase table",
@@ -81,37 +103,14 @@ TOOL_DEFS = [
         auth_slots=["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"],
         risk_class="write",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "supabase.table.select": table_select,
     "supabase.table.insert": table_insert,
+    "supabase.table.bulkInsert": table_bulk_insert,
     "supabase.table.update": table_update,
     "supabase.auth.createUser": auth_create_user,
-}
-
-
-@dataclass
-class SupabasePack:
-    name: str = "rig-pack-supabase"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = SupabasePack()
+})
 
+PACK = make_pack("rig-pack-supabase", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
@@ -1,7 +1,7 @@
 """Supabase tool implementations."""
 
-from .table import table_select, table_insert, table_update
+from .table import table_select, table_insert, table_bulk_insert, table_update
 from .auth import auth_create_user
 
-__all__ = ["table_select", "table_insert", "table_update", "auth_create_user"]
+__all__ = ["table_select", "table_insert", "table_bulk_insert", "table_update", "auth_create_user"]
 
@@ -0,0 +1,41 @@
+"""Shared Supabase clients."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+try:
+    from supabase import create_client
+except ImportError:  # the SDK is only needed once a tool is called
+    create_client = None
+
+
+@lru_cache(maxsize=32)
+def _cached_client(url: str, key: str) -> Any:
+    return create_client(url, key)
+
+
+def get_client(secrets: Dict[str, str]) -> Any:
+    """Get a cached Supabase client (and its HTTP pool) for the project URL and key."""
+    url = secrets.get("SUPABASE_URL")
+    key = secrets.get("SUPABASE_SERVICE_ROLE_KEY")
+
+    if not url or not key:
+        raise RigToolRaised(ToolError(
+            type="auth_error",
+            message="SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY required",
+            retryable=False,
+        ))
+
+    if create_client is None:
+        raise RigToolRaised(ToolError(
+            type="internal_error",
+            message="supabase package not installed. Install with: pip install supabase",
+            retryable=False,
+        ))
+
+    return _cached_client(url, key)
@@ -7,26 +7,16 @@ from typing import Any, Dict
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_supabase.tools._client import get_client
+
 
 def auth_create_user(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a Supabase user."""
-    from supabase import create_client
-    
-    url = secrets.get("SUPABASE_URL")
-    key = secrets.get("SUPABASE_SERVICE_ROLE_KEY")
-    
-    if not url or not key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY required",
-            retryable=False,
-        ))
-    
+    client = get_client(secrets)
+
     try:
-        client = create_client(url, key)
-        
         response = client.auth.admin.create_user({
             "email": args["email"],
             "password": args.get("password"),
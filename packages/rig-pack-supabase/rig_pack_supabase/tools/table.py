@@ -7,22 +7,10 @@ from typing import Any, Dict
 from rig_core.rtp import CallContext, ToolError
 from rig_core.runtime import RigToolRaised
 
+from rig_pack_supabase.tools._client import get_client
 
-def _get_client(secrets: Dict[str, str]):
-    """Get Supabase client."""
-    from supabase import create_client
-    
-    url = secrets.get("SUPABASE_URL")
-    key = secrets.get("SUPABASE_SERVICE_ROLE_KEY")
-    
-    if not url or not key:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY required",
-            retryable=False,
-        ))
-    
-    return create_client(url, key)
+# Rows per request, keeping bulk payloads well under PostgREST body limits
+BULK_BATCH_SIZE = 500
 
 
 def table_select(
@@ -30,7 +18,7 @@ def table_select(
 ) -> Dict[str, Any]:
     """Select from a Supabase table."""
     try:
-        client = _get_client(secrets)
+        client = get_client(secrets)
         
         query = client.table(args["table"]).select(args.get("columns", "*"))
         
@@ -55,9 +43,9 @@ def table_select(
 def table_insert(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
-    """Insert into a Supabase table."""
+    """Insert one row, or a list of rows in a single request, into a Supabase table."""
     try:
-        client = _get_client(secrets)
+        client = get_client(secrets)
         
         response = client.table(args["table"]).insert(args["data"]).execute()
         
@@ -70,12 +58,51 @@ def table_insert(
         ))
 
 
+def table_bulk_insert(
+    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
+) -> Dict[str, Any]:
+    """Insert many rows into a Supabase table, batch_size rows per request.
+
+    Batches that succeeded stay committed when a later one fails, so the
+    error says how many rows went in and where a caller should resume.
+    """
+    rows = args["rows"]
+    batch_size = args.get("batch_size", BULK_BATCH_SIZE)
+    committed = 0
+    
+    try:
+        table = get_client(secrets).table(args["table"])
+        
+        data = []
+        for start in range(0, len(rows), batch_size):
+            data += table.insert(rows[start:start + batch_size]).execute().data
+            committed = min(start + batch_size, len(rows))
+        
+        return {"data": data}
+    except Exception as e:
+        if not committed:
+            raise RigToolRaised(ToolError(
+                type="upstream_error",
+                message=str(e),
+                retryable=False,
+            ))
+        raise RigToolRaised(ToolError(
+            type="upstream_error",
+            message=f"{committed} of {len(rows)} rows committed before a batch failed: {e}",
+            retryable=False,
+            remediation_hints=[
+                f"Do not repeat the call: rows[:{committed}] are already inserted",
+                f"Resume with rows[{committed}:]",
+            ],
+        ))
+
+
 def table_update(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Update rows in a Supabase table."""
     try:
-        client = _get_client(secrets)
+        client = get_client(secrets)
         
         query = client.table(args["table"]).update(args["data"])
         
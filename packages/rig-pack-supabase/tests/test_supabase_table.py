@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from rig_core.runtime import RigToolRaised
+from rig_pack_supabase.tools import table
+
+
+class FakeTable:
+    """Commits each insert until the batch numbered fail_on."""
+
+    def __init__(self, fail_on: int) -> None:
+        self.fail_on = fail_on
+        self.committed: List[Dict[str, Any]] = []
+        self.batches = 0
+
+    def insert(self, rows: List[Dict[str, Any]]) -> SimpleNamespace:
+        def execute() -> SimpleNamespace:
+            self.batches += 1
+            if self.batches == self.fail_on:
+                raise RuntimeError("connection reset")
+            self.committed += rows
+            return SimpleNamespace(data=rows)
+
+        return SimpleNamespace(execute=execute)
+
+
+def _bulk_insert(monkeypatch: pytest.MonkeyPatch, fake: FakeTable, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    monkeypatch.setattr(table, "get_client", lambda secrets: SimpleNamespace(table=lambda name: fake))
+    return table.table_bulk_insert({"table": "t", "rows": rows, "batch_size": 2}, {}, {})
+
+
+def test_bulk_insert_reports_rows_committed_before_a_failed_batch(monkeypatch) -> None:
+    fake = FakeTable(fail_on=2)
+    rows = [{"id": i} for i in range(5)]
+
+    with pytest.raises(RigToolRaised) as raised:
+        _bulk_insert(monkeypatch, fake, rows)
+
+    err = raised.value.err
+    assert fake.committed == rows[:2]
+    assert err.retryable is False
+    assert err.message.startswith("2 of 5 rows committed")
+    assert "Resume with rows[2:]" in err.remediation_hints
+
+
+def test_bulk_insert_first_batch_failure_commits_nothing(monkeypatch) -> None:
+    fake = FakeTable(fail_on=1)
+
+    with pytest.raises(RigToolRaised) as raised:
+        _bulk_insert(monkeypatch, fake, [{"id": i} for i in range(5)])
+
+    assert fake.committed == []
+    assert raised.value.err.message == "connection reset"
+    assert raised.value.err.remediation_hints == []
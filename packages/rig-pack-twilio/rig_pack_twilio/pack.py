@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+from rig_core.packs import make_pack
 from rig_core.rtp import ToolDef
-from rig_core.runtime import RegisteredTool
+from rig_core.runtime import ToolImpl
 
 from rig_pack_twilio.tools import (
-    sms_send, calls_create, calls_status, verify_start, verify_check
+    sms_send, sms_send_batch, calls_create, calls_status, verify_start, verify_check
 )
 
 
-TOOL_DEFS = [
+TOOL_DEFS: Tuple[ToolDef, ...] = (
     ToolDef(
         name="twilio.sms.send",
         description="Send an SMS message via Twilio",
@@ -37,6 +38,40 @@ TOOL_DEFS = [
         auth_slots=["TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"],
         risk_class="write",
     ),
+    ToolDef(
+        name="twilio.sms.send_batch",
+        description="Send many SMS messages concurrently via Twilio",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "messages": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "to": {"type": "string", "description": "Recipient phone number"},
+                            "from_": {"type": "string", "description": "Sender phone number"},
+                            "body": {"type": "string", "description": "Message body"},
+                        },
+                        "required": ["to", "body"],
+                    },
+                    "minItems": 1,
+                },
+                "from_": {"type": "string", "description": "Default sender phone number"},
+            },
+            "required": ["messages"],
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "messages": {"type": "array"},
+                "failed": {"type": "integer"},
+            },
+        },
+        error_schema={"type": "object"},
+        auth_slots=["TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"],
+        risk_class="write",
+    ),
     ToolDef(
         name="twilio.calls.create",
         description="Create a phone call via Twilio",
@@ -120,38 +155,15 @@ TOOL_DEFS = [
         auth_slots=["TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"],
         risk_class="write",
     ),
-]
+)
 
-TOOL_IMPLS = {
+TOOL_IMPLS: Mapping[str, ToolImpl] = MappingProxyType({
     "twilio.sms.send": sms_send,
+    "twilio.sms.send_batch": sms_send_batch,
     "twilio.calls.create": calls_create,
     "twilio.calls.status": calls_status,
     "twilio.verify.start": verify_start,
     "twilio.verify.check": verify_check,
-}
-
-
-@dataclass
-class TwilioPack:
-    name: str = "rig-pack-twilio"
-    version: str = "0.1.0"
-    
-    def rig_pack_metadata(self) -> Dict[str, str]:
-        return {"name": self.name, "version": self.version}
-    
-    def rig_tools(self) -> List[ToolDef]:
-        return TOOL_DEFS
-    
-    def rig_impls(self) -> Dict[str, RegisteredTool]:
-        result = {}
-        for tool in TOOL_DEFS:
-            if tool.name in TOOL_IMPLS:
-                result[tool.name] = RegisteredTool(
-                    tool=tool, impl=TOOL_IMPLS[tool.name],
-                    pack=self.name, pack_version=self.version,
-                )
-        return result
-
-
-PACK = TwilioPack()
+})
 
+PACK = make_pack("rig-pack-twilio", "0.1.0", TOOL_DEFS, TOOL_IMPLS)
@@ -1,11 +1,12 @@
 """Twilio tool implementations."""
 
-from .sms import sms_send
+from .sms import sms_send, sms_send_batch
 from .calls import calls_create, calls_status
 from .verify import verify_start, verify_check
 
 __all__ = [
     "sms_send",
+    "sms_send_batch",
     "calls_create",
     "calls_status",
     "verify_start",
@@ -0,0 +1,196 @@
+"""Shared Twilio REST clients."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from rig_core import jsonutil
+from rig_core.rtp import ToolError
+from rig_core.runtime import RigToolRaised
+
+TWILIO_API = "https://api.twilio.com/2010-04-01"
+VERIFY_API = "https://verify.twilio.com/v2"
+
+# Sockets kept per event loop; concurrent RGP calls share these instead
+# of paying a fresh TLS handshake each.
+POOL_SIZE = 64
+
+# Built once: loading the CA bundle costs milliseconds, and every loop's
+# client verifies against the same roots.
+_SSL_CONTEXT = httpx.create_ssl_context()
+_SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+
+# httpx.AsyncClient pools are bound to the loop that created them, so one
+# client is kept per event loop and shared by every account; credentials
+# travel per request, so all tenants reuse the same TLS connections.
+_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+# Credentials Twilio answered 401 for, by Authorization header, so a
+# misconfigured caller fails fast instead of hammering the API.
+REJECTED_TTL_SECONDS = 60.0
+REJECTED_CACHE_SIZE = 1024
+_rejected: "OrderedDict[str, float]" = OrderedDict()
+
+
+def credentials(secrets: Dict[str, str]) -> Tuple[str, str]:
+    """Return (account_sid, auth_token), raising auth_error if either is missing."""
+    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
+    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
+
+    if not account_sid or not auth_token:
+        raise RigToolRaised(ToolError(
+            type="auth_error",
+            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
+            retryable=False,
+        ))
+    return account_sid, auth_token
+
+
+def _authorization(account_sid: str, auth_token: str) -> str:
+    return "Basic " + base64.b64encode(f"{account_sid}:{auth_token}".encode()).decode()
+
+
+def _is_rejected(authorization: str) -> bool:
+    with _lock:
+        rejected_at = _rejected.get(authorization)
+        if rejected_at is None:
+            return False
+        if time.monotonic() - rejected_at < REJECTED_TTL_SECONDS:
+            return True
+        del _rejected[authorization]
+        return False
+
+
+def _reject(authorization: str) -> None:
+    with _lock:
+        _rejected[authorization] = time.monotonic()
+        _rejected.move_to_end(authorization)
+        while len(_rejected) > REJECTED_CACHE_SIZE:
+            _rejected.popitem(last=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Account:
+    """One account's view of the shared client: its REST base URL and credentials."""
+
+    client: httpx.AsyncClient
+    base_url: str
+    authorization: str
+
+
+def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _clients.get(loop)
+        if client is None:
+            client = _clients[loop] = httpx.AsyncClient(
+                timeout=30.0,
+                # retries only covers failed connects, so a POST is never sent twice
+                transport=httpx.AsyncHTTPTransport(
+                    verify=_SSL_CONTEXT,
+                    retries=1,
+                    limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE),
+                ),
+            )
+    return client
+
+
+def get_client(secrets: Dict[str, str]) -> Account:
+    """Bind the account's credentials to the running loop's shared client.
+
+    Relative paths resolve under /2010-04-01/Accounts/{sid}; Verify calls
+    pass absolute VERIFY_API URLs through the same pool and credentials.
+    Credentials rejected within the last REJECTED_TTL_SECONDS raise
+    auth_error without a request.
+    """
+    account_sid, auth_token = credentials(secrets)
+    authorization = _authorization(account_sid, auth_token)
+    if _is_rejected(authorization):
+        raise RigToolRaised(ToolError(
+            type="auth_error",
+            message="Twilio rejected these credentials recently; check TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN",
+            retryable=False,
+        ))
+    return Account(_shared_client(), f"{TWILIO_API}/Accounts/{account_sid}", authorization)
+
+
+async def request(account: Account, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+    """Send a request and return the decoded JSON body, raising on error statuses."""
+    if url.startswith("/"):
+        url = account.base_url + url
+    response = await account.client.request(
+        method, url, headers={"Authorization": account.authorization}, **kwargs
+    )
+    if response.status_code == 401:
+        _reject(account.authorization)
+    response.raise_for_status()
+    try:
+        return jsonutil.loads(response.content)
+    except ValueError as e:
+        # The request went through; retrying would repeat it
+        raise RigToolRaised(ToolError(
+            type="upstream_error",
+            message=f"Twilio returned an unreadable {response.status_code} response: {e}",
+            upstream_code=str(response.status_code),
+            retryable=False,
+        ))
+
+
+def _error_body(e: httpx.HTTPStatusError) -> Dict[str, Any]:
+    try:
+        body = jsonutil.loads(e.response.content)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def error_message(e: Exception) -> str:
+    """Prefer Twilio's own error message over httpx's generic status text."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return _error_body(e).get("message") or str(e)
+    if isinstance(e, KeyError):
+        return f"Twilio response missing {e}"
+    return str(e) or type(e).__name__
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Read a delta-seconds Retry-After header, if Twilio sent one."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+def upstream_error(e: httpx.HTTPError) -> RigToolRaised:
+    """Map a failed Twilio request to a typed ToolError."""
+    if isinstance(e, httpx.TimeoutException):
+        return RigToolRaised(ToolError(type="timeout", message=str(e), retryable=True))
+    if not isinstance(e, httpx.HTTPStatusError):
+        return RigToolRaised(ToolError(type="upstream_error", message=str(e), retryable=True))
+    status = e.response.status_code
+    code = _error_body(e).get("code")
+    if status == 401:
+        return RigToolRaised(ToolError(
+            type="auth_error",
+            message=error_message(e),
+            upstream_code=str(code) if code else str(status),
+            retryable=False,
+        ))
+    return RigToolRaised(ToolError(
+        type="rate_limited" if status == 429 else "upstream_error",
+        message=error_message(e),
+        upstream_code=str(code) if code else str(status),
+        retryable=status == 429 or status >= 500,
+        retry_after_seconds=_retry_after(e.response) if status in (429, 503) else None,
+    ))
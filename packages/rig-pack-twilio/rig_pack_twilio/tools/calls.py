@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+from urllib.parse import quote
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+import httpx
 
+from rig_core.rtp import CallContext
 
-def calls_create(
+from rig_pack_twilio.tools._client import get_client, request, upstream_error
+
+
+async def calls_create(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Create a phone call via Twilio.
@@ -21,45 +25,30 @@ def calls_create(
     Returns:
         Call SID and status
     """
-    from twilio.rest import Client
-    from twilio.base.exceptions import TwilioRestException
+    account = get_client(secrets)
     
-    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
-    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
-    
-    if not account_sid or not auth_token:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
-            retryable=False,
-        ))
+    fields = (
+        ("To", args["to"]),
+        ("From", args.get("from_") or args.get("from")),
+        ("Url", args.get("url")),
+        ("Twiml", args.get("twiml")),
+    )
+    form = {k: v for k, v in fields if v is not None}
     
     try:
-        client = Client(account_sid, auth_token)
-        
-        call = client.calls.create(
-            to=args["to"],
-            from_=args.get("from_") or args.get("from"),
-            url=args.get("url"),
-            twiml=args.get("twiml"),
-        )
+        call = await request(account, "POST", "/Calls.json", data=form)
         
         return {
-            "sid": call.sid,
-            "status": call.status,
-            "to": call.to,
-            "from_": call.from_,
+            "sid": call["sid"],
+            "status": call["status"],
+            "to": call["to"],
+            "from_": call["from"],
         }
-    except TwilioRestException as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=str(e.code) if e.code else None,
-            retryable=e.code in [20003, 20429],
-        ))
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
 
 
-def calls_status(
+async def calls_status(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Get the status of a Twilio call.
@@ -72,34 +61,16 @@ def calls_status(
     Returns:
         Call status and details
     """
-    from twilio.rest import Client
-    from twilio.base.exceptions import TwilioRestException
-    
-    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
-    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
-    
-    if not account_sid or not auth_token:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
-            retryable=False,
-        ))
+    account = get_client(secrets)
     
     try:
-        client = Client(account_sid, auth_token)
-        call = client.calls(args["call_sid"]).fetch()
+        call = await request(account, "GET", f"/Calls/{quote(args['call_sid'], safe='')}.json")
         
         return {
-            "sid": call.sid,
-            "status": call.status,
-            "duration": call.duration,
-            "direction": call.direction,
+            "sid": call["sid"],
+            "status": call["status"],
+            "duration": call["duration"],
+            "direction": call["direction"],
         }
-    except TwilioRestException as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=str(e.code) if e.code else None,
-            retryable=False,
-        ))
-
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
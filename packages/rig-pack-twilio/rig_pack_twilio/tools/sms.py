@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+import httpx
 
+from rig_core.rtp import CallContext
 
-def sms_send(
+from rig_pack_twilio.tools._client import error_message, get_client, request, upstream_error
+
+# In-flight requests per batch; Twilio queues messages beyond the sender's MPS
+BATCH_CONCURRENCY = 32
+
+
+def _message_form(to: str, body: str, sender: str | None) -> Dict[str, str]:
+    form = {"To": to, "Body": body}
+    if sender:
+        form["From"] = sender
+    return form
+
+
+async def sms_send(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Send an SMS message via Twilio.
@@ -21,39 +35,57 @@ def sms_send(
     Returns:
         Message SID and status
     """
-    from twilio.rest import Client
-    from twilio.base.exceptions import TwilioRestException
-    
-    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
-    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
-    
-    if not account_sid or not auth_token:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
-            retryable=False,
-        ))
+    account = get_client(secrets)
     
     try:
-        client = Client(account_sid, auth_token)
-        
-        message = client.messages.create(
-            to=args["to"],
-            from_=args.get("from_") or args.get("from"),
-            body=args["body"],
-        )
+        message = await request(account, "POST", "/Messages.json", data=_message_form(
+            args["to"], args["body"], args.get("from_") or args.get("from"),
+        ))
         
         return {
-            "sid": message.sid,
-            "status": message.status,
-            "to": message.to,
-            "from_": message.from_,
+            "sid": message["sid"],
+            "status": message["status"],
+            "to": message["to"],
+            "from_": message["from"],
         }
-    except TwilioRestException as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=str(e.code) if e.code else None,
-            retryable=e.code in [20003, 20429],  # Auth retry, rate limit
-        ))
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
+
 
+async def sms_send_batch(
+    args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
+) -> Dict[str, Any]:
+    """Send many SMS messages concurrently via Twilio.
+    
+    Each message is reported separately, so a partial failure never causes
+    the delivered messages to be re-sent on retry.
+    
+    Args:
+        args: Input with messages (each with to, body, optional from_) and
+            an optional default from_
+        secrets: Must contain TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN
+        ctx: Call context
+        
+    Returns:
+        Per-message SID and status, or error
+    """
+    account = get_client(secrets)
+    default_from = args.get("from_")
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def send(message: Dict[str, Any]) -> Dict[str, Any]:
+        form = _message_form(message["to"], message["body"], message.get("from_") or default_from)
+        # Any failure stays with its message: an exception escaping gather
+        # would let the runtime retry, re-sending messages already delivered
+        try:
+            async with semaphore:
+                data = await request(account, "POST", "/Messages.json", data=form)
+            return {"sid": data["sid"], "status": data["status"], "to": data["to"]}
+        except Exception as e:
+            return {"to": message["to"], "error": error_message(e)}
+    
+    results = await asyncio.gather(*(send(m) for m in args["messages"]))
+    return {
+        "messages": results,
+        "failed": sum(1 for r in results if "error" in r),
+    }
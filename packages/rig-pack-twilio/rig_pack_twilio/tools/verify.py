@@ -2,13 +2,50 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+import threading
+from typing import Any, Dict, Tuple
+from urllib.parse import quote
+from weakref import WeakKeyDictionary
 
-from rig_core.rtp import CallContext, ToolError
-from rig_core.runtime import RigToolRaised
+import httpx
 
+from rig_core.rtp import CallContext
 
-def verify_start(
+from rig_pack_twilio.tools._client import VERIFY_API, Account, get_client, request, upstream_error
+
+
+# Starts for the same credentials, service, recipient and channel that arrive
+# while one is still in flight (a double-clicked "Resend") share its result
+# rather than sending a second code. Completed starts are never replayed.
+# Futures belong to the loop that created them, so they are kept per loop.
+_StartKey = Tuple[str, str, str, str]
+_in_flight: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_StartKey, asyncio.Future]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _service_url(service_sid: str, resource: str) -> str:
+    return f"{VERIFY_API}/Services/{quote(service_sid, safe='')}/{resource}"
+
+
+async def _start(account: Account, service_sid: str, to: str, channel: str) -> Dict[str, Any]:
+    try:
+        verification = await request(
+            account, "POST", _service_url(service_sid, "Verifications"),
+            data={"To": to, "Channel": channel},
+        )
+        
+        return {
+            "sid": verification["sid"],
+            "status": verification["status"],
+            "to": verification["to"],
+            "channel": verification["channel"],
+        }
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
+
+
+async def verify_start(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Start a verification via Twilio Verify.
@@ -21,45 +58,23 @@ def verify_start(
     Returns:
         Verification SID and status
     """
-    from twilio.rest import Client
-    from twilio.base.exceptions import TwilioRestException
-    
-    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
-    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
-    
-    if not account_sid or not auth_token:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
-            retryable=False,
-        ))
-    
-    try:
-        client = Client(account_sid, auth_token)
-        
-        verification = client.verify.v2.services(
-            args["service_sid"]
-        ).verifications.create(
-            to=args["to"],
-            channel=args.get("channel", "sms"),
-        )
-        
-        return {
-            "sid": verification.sid,
-            "status": verification.status,
-            "to": verification.to,
-            "channel": verification.channel,
-        }
-    except TwilioRestException as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=str(e.code) if e.code else None,
-            retryable=e.code in [20003, 20429],
-        ))
+    # Every caller goes through the credential check and the rejected cache
+    account = get_client(secrets)
+    service_sid, to, channel = args["service_sid"], args["to"], args.get("channel", "sms")
+    key = (account.authorization, service_sid, to, channel)
+    with _lock:
+        in_flight = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    pending = in_flight.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(_start(account, service_sid, to, channel))
+        in_flight[key] = pending
+        pending.add_done_callback(lambda _: in_flight.pop(key, None))
+    # shield: one caller being cancelled must not cancel the start the
+    # others are waiting on
+    return dict(await asyncio.shield(pending))
 
 
-def verify_check(
+async def verify_check(
     args: Dict[str, Any], secrets: Dict[str, str], ctx: CallContext
 ) -> Dict[str, Any]:
     """Check a verification code via Twilio Verify.
@@ -72,39 +87,18 @@ def verify_check(
     Returns:
         Verification status (approved/pending)
     """
-    from twilio.rest import Client
-    from twilio.base.exceptions import TwilioRestException
-    
-    account_sid = secrets.get("TWILIO_ACCOUNT_SID")
-    auth_token = secrets.get("TWILIO_AUTH_TOKEN")
-    
-    if not account_sid or not auth_token:
-        raise RigToolRaised(ToolError(
-            type="auth_error",
-            message="TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN required",
-            retryable=False,
-        ))
+    account = get_client(secrets)
     
     try:
-        client = Client(account_sid, auth_token)
-        
-        verification_check = client.verify.v2.services(
-            args["service_sid"]
-        ).verification_checks.create(
-            to=args["to"],
-            code=args["code"],
+        verification_check = await request(
+            account, "POST", _service_url(args["service_sid"], "VerificationCheck"),
+            data={"To": args["to"], "Code": args["code"]},
         )
         
         return {
-            "sid": verification_check.sid,
-            "status": verification_check.status,
-            "valid": verification_check.status == "approved",
+            "sid": verification_check["sid"],
+            "status": verification_check["status"],
+            "valid": verification_check["status"] == "approved",
         }
-    except TwilioRestException as e:
-        raise RigToolRaised(ToolError(
-            type="upstream_error",
-            message=str(e),
-            upstream_code=str(e.code) if e.code else None,
-            retryable=False,
-        ))
-
+    except httpx.HTTPError as e:
+        raise upstream_error(e)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from rig_pack_twilio.tools import _client
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_state():
+    _client._clients.clear()
+    _client._rejected.clear()
+    yield
+    _client._clients.clear()
+    _client._rejected.clear()
+
+
+@pytest.fixture
+def twilio() -> Callable[[Callable[[httpx.Request], httpx.Response]], List[httpx.Request]]:
+    """Route the running loop's shared client through a MockTransport handler.
+
+    Call from inside the test's coroutine; returns the list of requests sent.
+    """
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> List[httpx.Request]:
+        sent: List[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return handler(request)
+
+        _client._clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        return sent
+
+    return install
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from rig_core.policy import Policy
+from rig_core.runtime import RigRuntime, RigToolRaised
+from rig_core.secrets import SecretsStore
+from rig_pack_twilio.pack import PACK
+from rig_pack_twilio.tools import _client
+from rig_pack_twilio.tools.sms import sms_send
+
+
+SECRETS = {"TWILIO_ACCOUNT_SID": "AC123", "TWILIO_AUTH_TOKEN": "token"}
+MESSAGE = {"to": "+15550001", "from_": "+15559999", "body": "hi"}
+
+
+def _send_twice(twilio, handler, between=lambda: None):
+    """Send two SMS on one loop; return the requests sent and each call's ToolError."""
+
+    async def attempt():
+        try:
+            await sms_send(MESSAGE, SECRETS, {})
+        except RigToolRaised as e:
+            return e.err
+
+    async def run():
+        sent = twilio(handler)
+        first = await attempt()
+        between()
+        return sent, first, await attempt()
+
+    return asyncio.run(run())
+
+
+def test_rejected_credentials_short_circuit_later_calls(twilio) -> None:
+    sent, first, second = _send_twice(
+        twilio, lambda request: httpx.Response(401, json={"code": 20003, "message": "Authenticate"})
+    )
+
+    assert len(sent) == 1
+    assert (first.type, first.upstream_code, first.message) == ("auth_error", "20003", "Authenticate")
+    assert second.type == "auth_error"
+    assert "rejected these credentials recently" in second.message
+
+
+def test_rejected_credentials_expire(twilio, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(_client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    def later() -> None:
+        now[0] += _client.REJECTED_TTL_SECONDS
+
+    sent, first, second = _send_twice(twilio, lambda request: httpx.Response(401, json={}), later)
+
+    assert len(sent) == 2
+    assert first.type == second.type == "auth_error"
+
+
+def test_rate_limit_maps_to_rate_limited_with_retry_after(twilio) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "7"}, json={"code": 20429, "message": "Too Many Requests"})
+
+    sent, first, _ = _send_twice(twilio, handler)
+
+    assert len(sent) == 2
+    assert first.type == "rate_limited"
+    assert first.retryable is True
+    assert first.retry_after_seconds == 7.0
+    assert first.upstream_code == "20429"
+
+
+def test_unreadable_success_body_is_not_retried(twilio, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name, value in SECRETS.items():
+        monkeypatch.setenv(name, value)
+    runtime = RigRuntime(policy=Policy(), secrets=SecretsStore(), audit=None)
+    runtime.register("twilio.sms.send", PACK.rig_impls()["twilio.sms.send"])
+
+    async def run():
+        sent = twilio(lambda request: httpx.Response(201, content=b'{"sid": "SM1", "sta'))
+        return sent, await runtime.acall("twilio.sms.send", MESSAGE, {})
+
+    sent, result = asyncio.run(run())
+
+    assert len(sent) == 1
+    assert result.error.type == "upstream_error"
+    assert result.error.retryable is False
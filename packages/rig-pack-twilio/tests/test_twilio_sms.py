@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+
+from rig_pack_twilio.tools.sms import sms_send_batch
+
+
+SECRETS = {"TWILIO_ACCOUNT_SID": "AC123", "TWILIO_AUTH_TOKEN": "token"}
+
+
+def test_send_batch_reports_each_failure_without_raising(twilio) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        to = parse_qs(request.content.decode())["To"][0]
+        if to == "+15550001":
+            return httpx.Response(201, json={"sid": "SM1", "status": "queued", "to": to})
+        if to == "+15550002":
+            return httpx.Response(400, json={"code": 21211, "message": "Invalid 'To' Phone Number"})
+        return httpx.Response(201, content=b"<html>not json</html>")
+
+    async def run():
+        sent = twilio(handler)
+        out = await sms_send_batch(
+            {"messages": [{"to": f"+1555000{i}", "body": "hi"} for i in (1, 2, 3)], "from_": "+15559999"},
+            SECRETS,
+            {},
+        )
+        return sent, out
+
+    sent, out = asyncio.run(run())
+
+    assert len(sent) == 3
+    assert out["failed"] == 2
+    assert out["messages"][0] == {"sid": "SM1", "status": "queued", "to": "+15550001"}
+    assert out["messages"][1] == {"to": "+15550002", "error": "Invalid 'To' Phone Number"}
+    assert out["messages"][2]["to"] == "+15550003"
+    assert "error" in out["messages"][2]
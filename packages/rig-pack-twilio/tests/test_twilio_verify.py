@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from itertools import count
+
+import httpx
+
+from rig_core.runtime import RigToolRaised
+from rig_pack_twilio.tools.verify import verify_start
+
+
+SECRETS = {"TWILIO_ACCOUNT_SID": "AC123", "TWILIO_AUTH_TOKEN": "token"}
+
+
+def test_verify_start_coalesces_concurrent_duplicates(twilio) -> None:
+    sids = count(1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"sid": f"VE{next(sids)}", "status": "pending", "to": "+15550001", "channel": "sms"})
+
+    args = {"service_sid": "VA123", "to": "+15550001"}
+
+    async def run():
+        sent = twilio(handler)
+        results = await asyncio.gather(
+            verify_start(args, SECRETS, {}),
+            verify_start(dict(args), SECRETS, {}),
+            verify_start({**args, "channel": "call"}, SECRETS, {}),
+        )
+        # A completed start is never replayed
+        later = await verify_start(args, SECRETS, {})
+        return sent, results, later
+
+    sent, (first, second, other), later = asyncio.run(run())
+
+    assert len(sent) == 3
+    assert first == second and first is not second
+    assert len({first["sid"], other["sid"], later["sid"]}) == 3
+
+
+
+def test_verify_start_keeps_accounts_apart(twilio) -> None:
+    # The second account's credentials are bad: it must get its own 401, not
+    # the first account's verification
+    other_secrets = {"TWILIO_ACCOUNT_SID": "AC456", "TWILIO_AUTH_TOKEN": "bad"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        account_sid = base64.b64decode(request.headers["Authorization"].split()[1]).split(b":")[0]
+        if account_sid == b"AC123":
+            return httpx.Response(201, json={"sid": "VE1", "status": "pending", "to": "+15550001", "channel": "sms"})
+        return httpx.Response(401, json={"code": 20003, "message": "Authenticate"})
+
+    args = {"service_sid": "VA123", "to": "+15550001"}
+
+    async def run():
+        sent = twilio(handler)
+        results = await asyncio.gather(
+            verify_start(args, SECRETS, {}),
+            verify_start(args, other_secrets, {}),
+            return_exceptions=True,
+        )
+        return sent, results
+
+    sent, (ok, rejected) = asyncio.run(run())
+
+    assert len(sent) == 2
+    assert ok["sid"] == "VE1"
+    assert isinstance(rejected, RigToolRaised)
+    assert rejected.err.type == "auth_error"
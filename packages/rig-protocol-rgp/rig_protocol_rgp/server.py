@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+import hashlib
+import operator
+import threading
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from rig_core import jsonutil
 from rig_core.registry import ToolRegistry
+from rig_core.rtp import ToolDef, ToolResult
 from rig_core.runtime import RigRuntime
 
 
@@ -13,6 +19,59 @@ class CallBody(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
+class CallResponse(BaseModel):
+    ok: bool
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[Dict[str, Any]] = None
+    correlation_id: Optional[str] = None
+    pack: Optional[str] = None
+    pack_version: Optional[str] = None
+    interface_hash: Optional[str] = None
+    pack_set_version: Optional[str] = None
+
+
+_TOOL_FIELDS = (
+    "name",
+    "description",
+    "input_schema",
+    "output_schema",
+    "error_schema",
+    "auth_slots",
+    "risk_class",
+    "tags",
+)
+_tool_values = operator.attrgetter(*_TOOL_FIELDS)
+
+
+def _tool_dict(t: ToolDef) -> Dict[str, Any]:
+    return dict(zip(_TOOL_FIELDS, _tool_values(t)))
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve pre-encoded JSON, or 304 if the client already holds this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (v.strip() for v in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _call_response(result: ToolResult) -> CallResponse:
+    return CallResponse(
+        ok=result.ok,
+        output=result.output,
+        error=None if not result.error else result.error.to_dict(),
+        correlation_id=result.correlation_id,
+        pack=result.pack,
+        pack_version=result.pack_version,
+        interface_hash=result.interface_hash,
+        pack_set_version=result.pack_set_version,
+    )
+
+
 def create_app(registry: ToolRegistry, runtime: RigRuntime) -> FastAPI:
     app = FastAPI(title="RIG Gateway Protocol", version="0.1.0")
 
@@ -20,67 +79,51 @@ def create_app(registry: ToolRegistry, runtime: RigRuntime) -> FastAPI:
     def health() -> Dict[str, str]:
         return {"status": "ok"}
 
+    # Encoded catalog responses as (ETag, body), dropped whenever the registry changes
+    bodies: Dict[str, Tuple[str, bytes]] = {}
+    bodies_revision = registry.revision
+    bodies_lock = threading.Lock()
+
+    def cached_body(key: str, build: Callable[[], Any]) -> Optional[Tuple[str, bytes]]:
+        nonlocal bodies_revision
+        with bodies_lock:
+            if bodies_revision != registry.revision:
+                bodies.clear()
+                bodies_revision = registry.revision
+            hit = bodies.get(key)
+            if hit is None:
+                payload = build()
+                if payload is None:
+                    return None
+                body = jsonutil.dumps_bytes(payload)
+                hit = bodies[key] = (_etag(body), body)
+            return hit
+
     @app.get("/v1/tools")
-    def tools() -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
-        for t in registry.list_tools():
-            out.append(
-                {
-                    "name": t.name,
-                    "description": t.description,
-                    "input_schema": t.input_schema,
-                    "output_schema": t.output_schema,
-                    "error_schema": t.error_schema,
-                    "auth_slots": t.auth_slots,
-                    "risk_class": t.risk_class,
-                    "tags": t.tags,
-                }
-            )
-        return out
+    def tools(request: Request) -> Response:
+        etag, body = cached_body("", lambda: [_tool_dict(t) for t in registry.list_tools()])
+        return _json_response(request, body, etag)
 
     @app.get("/v1/tools/{name}")
-    def tool(name: str) -> Dict[str, Any]:
-        t = registry.get(name)
-        if not t:
+    def tool(name: str, request: Request) -> Response:
+        def build() -> Optional[Dict[str, Any]]:
+            t = registry.get(name)
+            return _tool_dict(t) if t else None
+
+        hit = cached_body(name, build)
+        if hit is None:
             raise HTTPException(status_code=404, detail="tool not found")
-        return {
-            "name": t.name,
-            "description": t.description,
-            "input_schema": t.input_schema,
-            "output_schema": t.output_schema,
-            "error_schema": t.error_schema,
-            "auth_slots": t.auth_slots,
-            "risk_class": t.risk_class,
-            "tags": t.tags,
-        }
+        return _json_response(request, hit[1], hit[0])
 
     @app.post("/v1/tools/{name}:call")
-    def call(name: str, body: CallBody) -> Dict[str, Any]:
+    def call(name: str, body: CallBody) -> CallResponse:
         ctx = body.context or {}
         result = runtime.call(name, body.args, ctx)  # type: ignore
-        return {
-            "ok": result.ok,
-            "output": result.output,
-            "error": None if not result.error else result.error.__dict__,
-            "correlation_id": result.correlation_id,
-            "pack": result.pack,
-            "pack_version": result.pack_version,
-            "interface_hash": result.interface_hash,
-            "pack_set_version": result.pack_set_version,
-        }
+        return _call_response(result)
 
     @app.post("/v1/approvals/{token}:approve")
-    def approve(token: str) -> Dict[str, Any]:
+    def approve(token: str) -> CallResponse:
         result = runtime.approve_and_call(token)
-        return {
-            "ok": result.ok,
-            "output": result.output,
-            "error": None if not result.error else result.error.__dict__,
-            "correlation_id": result.correlation_id,
-            "pack": result.pack,
-            "pack_version": result.pack_version,
-            "interface_hash": result.interface_hash,
-            "pack_set_version": result.pack_set_version,
-        }
+        return _call_response(result)
 
     return app
@@ -1,12 +1,11 @@
 """Generate RIG hero pack scaffolding."""
 
-import os
 from pathlib import Path
 
 PACKS = {
     "twilio": {
         "description": "SMS, voice calls, and verification",
-        "dependency": "twilio>=8.0.0",
+        "dependencies": ("httpx>=0.27.0",),
         "auth_env": "TWILIO_ACCOUNT_SID,TWILIO_AUTH_TOKEN",
         "tools": [
             ("twilio.sms.send", "write", "Send an SMS message"),
@@ -19,7 +18,7 @@ PACKS = {
     },
     "slack": {
         "description": "Slack messaging and collaboration",
-        "dependency": "slack-sdk>=3.0.0",
+        "dependencies": ("slack-sdk>=3.0.0", "aiohttp>=3.8.0"),
         "auth_env": "SLACK_BOT_TOKEN",
         "tools": [
             ("slack.messages.post", "write", "Post a message to a channel"),
@@ -32,7 +31,7 @@ PACKS = {
     },
     "sendgrid": {
         "description": "Email delivery and marketing",
-        "dependency": "sendgrid>=6.0.0",
+        "dependencies": ("httpx>=0.27.0",),
         "auth_env": "SENDGRID_API_KEY",
         "tools": [
             ("sendgrid.email.send", "write", "Send an email"),
@@ -45,7 +44,7 @@ PACKS = {
     },
     "github": {
         "description": "GitHub repository management",
-        "dependency": "PyGithub>=2.0.0",
+        "dependencies": ("PyGithub>=2.0.0",),
         "auth_env": "GITHUB_TOKEN",
         "tools": [
             ("github.issues.create", "write", "Create an issue"),
@@ -58,7 +57,7 @@ PACKS = {
     },
     "google": {
         "description": "Google Workspace (Sheets, Drive, Gmail)",
-        "dependency": "google-api-python-client>=2.0.0,google-auth>=2.0.0",
+        "dependencies": ("httpx[http2]>=0.27.0", "google-auth>=2.0.0"),
         "auth_env": "GOOGLE_CREDENTIALS_JSON",
         "tools": [
             ("google.sheets.values.get", "read", "Get spreadsheet values"),
@@ -71,7 +70,7 @@ PACKS = {
     },
     "notion": {
         "description": "Notion workspace management",
-        "dependency": "notion-client>=2.0.0",
+        "dependencies": ("notion-client>=2.0.0",),
         "auth_env": "NOTION_TOKEN",
         "tools": [
             ("notion.pages.create", "write", "Create a page"),
@@ -84,7 +83,7 @@ PACKS = {
     },
     "airtable": {
         "description": "Airtable database management",
-        "dependency": "pyairtable>=2.0.0",
+        "dependencies": ("pyairtable>=2.0.0",),
         "auth_env": "AIRTABLE_API_KEY",
         "tools": [
             ("airtable.records.create", "write", "Create a record"),
@@ -97,7 +96,7 @@ PACKS = {
     },
     "supabase": {
         "description": "Supabase backend services",
-        "dependency": "supabase>=2.0.0",
+        "dependencies": ("supabase>=2.0.0",),
         "auth_env": "SUPABASE_URL,SUPABASE_SERVICE_ROLE_KEY",
         "tools": [
             ("supabase.auth.createUser", "write", "Create a user"),
@@ -111,7 +110,7 @@ PACKS = {
     },
     "elevenlabs": {
         "description": "AI voice synthesis",
-        "dependency": "elevenlabs>=1.0.0",
+        "dependencies": ("elevenlabs>=1.0.0",),
         "auth_env": "ELEVENLABS_API_KEY",
         "tools": [
             ("elevenlabs.voices.list", "read", "List available voices"),
@@ -133,11 +132,10 @@ def generate_pack(pack_id: str, config: dict, base_dir: Path):
     module_dir = pack_dir / module_name
     tools_dir = module_dir / "tools"
     
-    os.makedirs(tools_dir, exist_ok=True)
+    tools_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate pyproject.toml
-    deps = config["dependency"].split(",")
-    dep_list = ",\n  ".join([f'"{d.strip()}"' for d in deps])
+    dep_list = ",\n  ".join(f'"{d}"' for d in config["dependencies"])
     
     pyproject = f'''[build-system]
 requires = ["setuptools>=68", "wheel"]
@@ -163,8 +161,7 @@ dependencies = [
 packages = ["{module_name}", "{module_name}.tools"]
 '''
     
-    with open(pack_dir / "pyproject.toml", "w") as f:
-        f.write(pyproject)
+    (pack_dir / "pyproject.toml").write_text(pyproject)
     
     print(f"Generated {pack_name}")
 
@@ -1,8 +1,6 @@
 """Test RIG adapters - OpenAI and MCP."""
 
 import json
-import tempfile
-import os
 
 import pytest
 
@@ -15,83 +13,82 @@ from rig_core.rtp import ToolDef
 from rig_core.secrets import SecretsStore
 
 
-class TestOpenAIAdapter:
-    """Test OpenAI tools adapter."""
+_DEFAULT_POLICY = Policy(allowed_tools=None, require_approval_for=set(), timeout_seconds=30, retries=2)
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite") as f:
-            db_path = f.name
-        yield db_path
-        if os.path.exists(db_path):
-            os.unlink(db_path)
-
-    @pytest.fixture
-    def registry(self):
-        """Create a test registry with sample tools."""
-        registry = ToolRegistry()
-        
-        # Add test tools
-        tools = [
-            ToolDef(
-                name="test.greet",
-                description="Greet a person by name",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Person's name"},
-                    },
-                    "required": ["name"],
+
+@pytest.fixture(scope="module")
+def registry():
+    """Create a test registry with sample tools."""
+    registry = ToolRegistry()
+
+    # Add test tools
+    tools = [
+        ToolDef(
+            name="test.greet",
+            description="Greet a person by name",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Person's name"},
                 },
-                output_schema={"type": "object", "properties": {"message": {"type": "string"}}},
-                error_schema={"type": "object"},
-                risk_class="read",
-            ),
-            ToolDef(
-                name="test.calculate",
-                description="Calculate sum of two numbers",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "number"},
-                        "b": {"type": "number"},
-                    },
-                    "required": ["a", "b"],
+                "required": ["name"],
+            },
+            output_schema={"type": "object", "properties": {"message": {"type": "string"}}},
+            error_schema={"type": "object"},
+            risk_class="read",
+        ),
+        ToolDef(
+            name="test.calculate",
+            description="Calculate sum of two numbers",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "a": {"type": "number"},
+                    "b": {"type": "number"},
                 },
-                output_schema={"type": "object", "properties": {"result": {"type": "number"}}},
-                error_schema={"type": "object"},
-                risk_class="read",
-            ),
-        ]
-        
-        registry.register_tools(tools)
-        return registry
-
-    @pytest.fixture
-    def runtime(self, temp_db, registry):
-        """Create a runtime with test tools registered."""
-        audit = AuditLog(temp_db)
-        policy = Policy(allowed_tools=None, require_approval_for=set(), timeout_seconds=30, retries=2)
-        secrets = SecretsStore()
-        runtime = RigRuntime(policy=policy, secrets=secrets, audit=audit)
-        
-        # Register implementations
-        def greet_impl(args, secrets, ctx):
-            return {"message": f"Hello, {args['name']}!"}
-        
-        def calc_impl(args, secrets, ctx):
-            return {"result": args["a"] + args["b"]}
-        
-        for tool_def in registry.list_tools():
-            if tool_def.name == "test.greet":
-                reg = RegisteredTool(tool=tool_def, impl=greet_impl, pack="test", pack_version="1.0.0")
-            else:
-                reg = RegisteredTool(tool=tool_def, impl=calc_impl, pack="test", pack_version="1.0.0")
-            runtime.register(tool_def.name, reg)
-        
-        runtime.set_snapshot_meta("test-hash", "test-version")
-        return runtime
+                "required": ["a", "b"],
+            },
+            output_schema={"type": "object", "properties": {"result": {"type": "number"}}},
+            error_schema={"type": "object"},
+            risk_class="read",
+        ),
+    ]
+
+    registry.register_tools(tools)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def runtime(tmp_path_factory, registry):
+    """Create a runtime with test tools registered."""
+    audit = AuditLog(str(tmp_path_factory.mktemp("audit") / "audit.sqlite"))
+    secrets = SecretsStore()
+    runtime = RigRuntime(policy=_DEFAULT_POLICY, secrets=secrets, audit=audit)
+
+    # Register implementations
+    def greet_impl(args, secrets, ctx):
+        return {"message": f"Hello, {args['name']}!"}
+
+    def calc_impl(args, secrets, ctx):
+        return {"result": args["a"] + args["b"]}
+
+    for tool_def in registry.list_tools():
+        if tool_def.name == "test.greet":
+            reg = RegisteredTool(tool=tool_def, impl=greet_impl, pack="test", pack_version="1.0.0")
+        else:
+            reg = RegisteredTool(tool=tool_def, impl=calc_impl, pack="test", pack_version="1.0.0")
+        runtime.register(tool_def.name, reg)
+
+    runtime.set_snapshot_meta("test-hash", "test-version")
+    return runtime
+
+
+def _tools_by_name(registry, runtime):
+    return {t["name"]: t for t in openai_tools(registry, runtime)}
+
+
+class TestOpenAIAdapter:
+    """Test OpenAI tools adapter."""
 
     def test_openai_tools_returns_list(self, registry, runtime):
         """Test that openai_tools returns a list of tool definitions."""
@@ -100,25 +97,20 @@ class TestOpenAIAdapter:
         assert isinstance(tools, list)
         assert len(tools) == 2
 
-    def test_openai_tool_structure(self, registry, runtime):
+    @pytest.mark.parametrize("name", ["test.greet", "test.calculate"])
+    def test_openai_tool_structure(self, registry, runtime, name):
         """Test that each tool has correct OpenAI structure."""
-        tools = openai_tools(registry, runtime)
+        tool = _tools_by_name(registry, runtime)[name]
         
-        for tool in tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "parameters" in tool
-            assert "handler" in tool
-            assert isinstance(tool["parameters"], dict)
-            assert callable(tool["handler"])
+        assert "description" in tool
+        assert "parameters" in tool
+        assert "handler" in tool
+        assert isinstance(tool["parameters"], dict)
+        assert callable(tool["handler"])
 
     def test_openai_tool_handler_execution(self, registry, runtime):
         """Test that tool handlers execute correctly."""
-        tools = openai_tools(registry, runtime)
-        
-        # Find the greet tool
-        greet_tool = next(t for t in tools if t["name"] == "test.greet")
-        handler = greet_tool["handler"]
+        handler = _tools_by_name(registry, runtime)["test.greet"]["handler"]
         
         # Execute the handler
         result = handler(arguments={"name": "Alice"}, tenant_id="test-tenant", run_id="test-run")
@@ -150,15 +142,14 @@ class TestOpenAIAdapter:
 
     def test_handler_error_response(self, registry, runtime):
         """Test handler returns proper error for policy-blocked tools."""
-        # Block all tools
+        # Block all tools; the runtime is shared across the module, so restore it after
         runtime.policy = Policy(allowed_tools=set(), require_approval_for=set(), timeout_seconds=30, retries=2)
-        
-        tools = openai_tools(registry, runtime)
-        greet_tool = next(t for t in tools if t["name"] == "test.greet")
-        handler = greet_tool["handler"]
-        
-        result = handler(arguments={"name": "Alice"}, tenant_id="test", run_id="test-run")
-        result_data = json.loads(result)
+        try:
+            handler = _tools_by_name(registry, runtime)["test.greet"]["handler"]
+            
+            result_data = handler.call_raw(arguments={"name": "Alice"}, tenant_id="test", run_id="test-run")
+        finally:
+            runtime.policy = _DEFAULT_POLICY
         
         assert result_data["error"] is True
         assert result_data["type"] == "policy_blocked"
@@ -0,0 +1,58 @@
+"""Test the read-tool response cache."""
+
+import asyncio
+
+import pytest
+
+from rig_core.cache import ttl_cache
+
+
+@pytest.mark.unit
+def test_ttl_cache_keys_on_args_and_secrets():
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def tool(args, secrets, ctx):
+        calls.append(args)
+        return {"value": args["q"]}
+
+    first = tool({"q": 1}, {"TOKEN": "xoxb-a"}, {})
+    first["value"] = "mutated"
+    assert tool({"q": 1}, {"TOKEN": "xoxb-a"}, {}) == {"value": 1}
+    assert len(calls) == 1
+
+    tool({"q": 1}, {"TOKEN": "xoxb-b"}, {})
+    tool({"q": 2}, {"TOKEN": "xoxb-a"}, {})
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+def test_ttl_cache_isolates_nested_values():
+    @ttl_cache(ttl=60)
+    def tool(args, secrets, ctx):
+        return {"results": [{"id": "a"}]}
+
+    tool({}, {}, {})["results"][0]["id"] = "mutated"
+    tool({}, {}, {})["results"].append({"id": "b"})
+    assert tool({}, {}, {}) == {"results": [{"id": "a"}]}
+
+
+@pytest.mark.unit
+def test_ttl_cache_expires_and_skips_errors():
+    calls = []
+
+    @ttl_cache(ttl=0)
+    async def tool(args, secrets, ctx):
+        calls.append(args)
+        if args.get("fail"):
+            raise RuntimeError("boom")
+        return {"ok": True}
+
+    assert asyncio.run(tool({}, {}, {})) == {"ok": True}
+    assert asyncio.run(tool({}, {}, {})) == {"ok": True}
+    assert len(calls) == 2
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            asyncio.run(tool({"fail": True}, {}, {}))
+    assert len(calls) == 4
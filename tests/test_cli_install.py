@@ -13,27 +13,28 @@ from rig_core.pack_index import PackIndex
 from rig_core.lockfile import RigLock
 
 
+_INDEX_ECHO_BYTES = json.dumps({
+    "api_version": 1,
+    "generated_at": "2026-01-13T00:00:00Z",
+    "packs": {
+        "echo": {
+            "display_name": "Echo",
+            "python": {"package": "rig-pack-echo", "min_rig": "0.1.0"},
+        }
+    },
+}).encode()
+
+_INDEX_EMPTY_BYTES = json.dumps({"api_version": 1, "generated_at": "2026-01-13T00:00:00Z", "packs": {}}).encode()
+
+
 class TestPackInstaller:
     """Test pack installer functionality."""
 
     def test_install_dry_run(self, tmp_path):
         """Test dry run installation."""
-        # Create a mock index
-        index_data = {
-            "api_version": 1,
-            "generated_at": "2026-01-13T00:00:00Z",
-            "packs": {
-                "echo": {
-                    "display_name": "Echo",
-                    "python": {"package": "rig-pack-echo", "min_rig": "0.1.0"},
-                }
-            },
-        }
-
-        # Save index to temp file
+        # Save a mock index to a temp file
         index_file = tmp_path / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(index_data, f)
+        index_file.write_bytes(_INDEX_ECHO_BYTES)
 
         # Create installer with temp paths
         lock_path = tmp_path / "rig.lock"
@@ -52,11 +53,8 @@ class TestPackInstaller:
 
     def test_install_nonexistent_pack(self, tmp_path):
         """Test installing a pack that doesn't exist."""
-        index_data = {"api_version": 1, "generated_at": "2026-01-13T00:00:00Z", "packs": {}}
-
         index_file = tmp_path / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(index_data, f)
+        index_file.write_bytes(_INDEX_EMPTY_BYTES)
 
         lock_path = tmp_path / "rig.lock"
         installer = PackInstaller(lock_path=lock_path)
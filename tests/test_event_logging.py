@@ -1,7 +1,6 @@
 """Test RIG v0 event logging system."""
 
-import os
-import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -13,51 +12,47 @@ from rig_core.rtp import CallContext, ToolDef
 from rig_core.secrets import SecretsStore
 
 
+_DEFAULT_POLICY = Policy(allowed_tools=None, require_approval_for=set(), timeout_seconds=30, retries=2)
+
+
+@pytest.fixture(scope="module")
+def audit_log(tmp_path_factory):
+    """Create an audit log shared by the module; tests keep to their own run and tenant ids."""
+    return AuditLog(str(tmp_path_factory.mktemp("audit") / "audit.sqlite"))
+
+
+@pytest.fixture(scope="module")
+def runtime(audit_log):
+    """Create a runtime with audit logging."""
+    secrets = SecretsStore()
+    runtime = RigRuntime(policy=_DEFAULT_POLICY, secrets=secrets, audit=audit_log)
+
+    # Register a simple test tool
+    def test_impl(args, secrets, ctx):
+        # Take measurable time so duration_ms is non-zero
+        time.sleep(0.002)
+        return {"result": f"Hello {args.get('name', 'World')}"}
+
+    tool_def = ToolDef(
+        name="test.greet",
+        description="A test greeting tool",
+        input_schema={"type": "object", "properties": {"name": {"type": "string"}}},
+        output_schema={"type": "object", "properties": {"result": {"type": "string"}}},
+        error_schema={"type": "object"},
+        auth_slots=["env:TEST_API_KEY"],
+        risk_class="read",
+    )
+
+    reg_tool = RegisteredTool(tool=tool_def, impl=test_impl, pack="test-pack", pack_version="1.0.0")
+    runtime.register("test.greet", reg_tool)
+    runtime.set_snapshot_meta("test-hash", "test-version")
+
+    return runtime
+
+
 class TestEventLogging:
     """Test event logging with v0 requirements."""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite") as f:
-            db_path = f.name
-        yield db_path
-        # Cleanup
-        if os.path.exists(db_path):
-            os.unlink(db_path)
-
-    @pytest.fixture
-    def audit_log(self, temp_db):
-        """Create an audit log instance."""
-        return AuditLog(temp_db)
-
-    @pytest.fixture
-    def runtime(self, audit_log):
-        """Create a runtime with audit logging."""
-        policy = Policy(allowed_tools=None, require_approval_for=set(), timeout_seconds=30, retries=2)
-        secrets = SecretsStore()
-        runtime = RigRuntime(policy=policy, secrets=secrets, audit=audit_log)
-        
-        # Register a simple test tool
-        def test_impl(args, secrets, ctx):
-            return {"result": f"Hello {args.get('name', 'World')}"}
-        
-        tool_def = ToolDef(
-            name="test.greet",
-            description="A test greeting tool",
-            input_schema={"type": "object", "properties": {"name": {"type": "string"}}},
-            output_schema={"type": "object", "properties": {"result": {"type": "string"}}},
-            error_schema={"type": "object"},
-            auth_slots=["env:TEST_API_KEY"],
-            risk_class="read",
-        )
-        
-        reg_tool = RegisteredTool(tool=tool_def, impl=test_impl, pack="test-pack", pack_version="1.0.0")
-        runtime.register("test.greet", reg_tool)
-        runtime.set_snapshot_meta("test-hash", "test-version")
-        
-        return runtime
-
     def test_compute_input_hash(self):
         """Test input hash computation."""
         args1 = {"name": "Alice", "age": 30}
@@ -102,45 +97,59 @@ class TestEventLogging:
         # Create and write events
         event1 = now_event(
             tool_name="test.tool1",
-            tenant_id="tenant-123",
-            run_id="run-1",
+            tenant_id="store-tenant-123",
+            run_id="store-run-1",
             input_hash="hash1",
             outcome="ok",
             duration_ms=100,
         )
         event2 = now_event(
             tool_name="test.tool2",
-            tenant_id="tenant-123",
-            run_id="run-2",
+            tenant_id="store-tenant-123",
+            run_id="store-run-2",
             input_hash="hash2",
             outcome="error",
             duration_ms=200,
         )
         event3 = now_event(
             tool_name="test.tool3",
-            tenant_id="tenant-456",
-            run_id="run-3",
+            tenant_id="store-tenant-456",
+            run_id="store-run-3",
             input_hash="hash3",
             outcome="ok",
             duration_ms=150,
         )
         
-        audit_log.write(event1)
-        audit_log.write(event2)
-        audit_log.write(event3)
+        audit_log.write_many([event1, event2, event3])
         
         # Query by run_id
-        run1_events = audit_log.query_by_run_id("run-1")
+        run1_events = audit_log.query_by_run_id("store-run-1")
         assert len(run1_events) == 1
         assert run1_events[0]["tool"] == "test.tool1"
         
         # Query by tenant_id
-        tenant123_events = audit_log.query_by_tenant_id("tenant-123")
+        tenant123_events = audit_log.query_by_tenant_id("store-tenant-123")
         assert len(tenant123_events) == 2
         
-        tenant456_events = audit_log.query_by_tenant_id("tenant-456")
+        tenant456_events = audit_log.query_by_tenant_id("store-tenant-456")
         assert len(tenant456_events) == 1
 
+    def test_in_memory_audit_log(self):
+        """Test that a ":memory:" audit log keeps events across calls."""
+        audit_log = AuditLog(":memory:")
+        audit_log.write(now_event(
+            tool_name="test.tool",
+            tenant_id="memory-tenant",
+            run_id="memory-run",
+            input_hash="hash",
+            outcome="ok",
+            duration_ms=1,
+        ))
+        
+        events = audit_log.query_by_run_id("memory-run")
+        assert len(events) == 1
+        assert events[0]["tenant_id"] == "memory-tenant"
+
     def test_runtime_generates_events(self, runtime, audit_log):
         """Test that runtime generates exactly one event per tool call."""
         ctx = CallContext(tenant_id="tenant-123", request_id="run-abc")
@@ -163,23 +172,25 @@ class TestEventLogging:
         assert event["input_hash"] is not None
         assert event["redacted_auth_marker"] == "env:TEST_API_KEY"
 
-    def test_event_outcomes(self, runtime, audit_log):
+    @pytest.mark.parametrize(
+        "allowed_tools,require_approval_for,expected_outcome",
+        [
+            (set(), set(), "policy_denied"),
+            (None, {"read"}, "approval_required"),
+        ],
+    )
+    def test_event_outcomes(self, runtime, audit_log, allowed_tools, require_approval_for, expected_outcome):
         """Test different event outcomes."""
-        # Test policy_denied outcome
-        runtime.policy = Policy(allowed_tools=set(), require_approval_for=set(), timeout_seconds=30, retries=2)
-        ctx1 = CallContext(tenant_id="tenant-1", request_id="run-1")
-        result1 = runtime.call("test.greet", {"name": "Alice"}, ctx1)
-        
-        assert result1.ok is False
-        events1 = audit_log.query_by_run_id("run-1")
-        assert events1[0]["outcome"] == "policy_denied"
-        
-        # Test approval_required outcome
-        runtime.policy = Policy(allowed_tools=None, require_approval_for={"read"}, timeout_seconds=30, retries=2)
-        ctx2 = CallContext(tenant_id="tenant-2", request_id="run-2")
-        result2 = runtime.call("test.greet", {"name": "Bob"}, ctx2)
-        
-        assert result2.ok is False
-        events2 = audit_log.query_by_run_id("run-2")
-        assert events2[0]["outcome"] == "approval_required"
-
+        run_id = f"outcome-{expected_outcome}"
+        # The runtime is shared across the module, so restore its policy after
+        runtime.policy = Policy(
+            allowed_tools=allowed_tools, require_approval_for=require_approval_for, timeout_seconds=30, retries=2
+        )
+        try:
+            result = runtime.call("test.greet", {"name": "Alice"}, CallContext(tenant_id="tenant-1", request_id=run_id))
+        finally:
+            runtime.policy = _DEFAULT_POLICY
+        
+        assert result.ok is False
+        events = audit_log.query_by_run_id(run_id)
+        assert events[0]["outcome"] == expected_outcome
@@ -2,6 +2,9 @@
 Tests for MCP Bridge.
 """
 
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -11,6 +14,8 @@ from rig_core.rtp import ToolDef, ToolResult
 from rig_core.policy import Policy
 from rig_core.secrets import SecretsStore
 
+from rig_bridge_mcp import McpBridgeConfig, RigMcpBridge, create_mcp_bridge
+
 
 class TestMCPBridge:
     """Test MCP Bridge functionality."""
@@ -54,46 +59,34 @@ class TestMCPBridge:
 
     def test_create_bridge(self, registry, runtime):
         """Test creating an MCP bridge."""
-        from rig_bridge_mcp import create_mcp_bridge
-        
         bridge = create_mcp_bridge(registry, runtime)
         
         assert bridge is not None
         assert bridge.registry == registry
         assert bridge.runtime == runtime
 
-    def test_bridge_config(self):
-        """Test MCP bridge configuration."""
-        from rig_bridge_mcp import McpBridgeConfig
-        
-        config = McpBridgeConfig(
-            transport="http",
-            host="0.0.0.0",
-            port=9000,
-            debug=True,
-        )
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, {"transport": "stdio", "host": "127.0.0.1", "port": 8789, "debug": False}),
+            (
+                {"transport": "http", "host": "0.0.0.0", "port": 9000, "debug": True},
+                {"transport": "http", "host": "0.0.0.0", "port": 9000, "debug": True},
+            ),
+        ],
+        ids=["default", "http"],
+    )
+    def test_bridge_config(self, kwargs, expected):
+        """Test MCP bridge configuration and its defaults."""
+        config = McpBridgeConfig(**kwargs)
         
-        assert config.transport == "http"
-        assert config.host == "0.0.0.0"
-        assert config.port == 9000
-        assert config.debug is True
-
-    def test_bridge_default_config(self):
-        """Test default MCP bridge configuration."""
-        from rig_bridge_mcp import McpBridgeConfig
-        
-        config = McpBridgeConfig()
-        
-        assert config.transport == "stdio"
-        assert config.host == "127.0.0.1"
-        assert config.port == 8789
-        assert config.debug is False
+        for field, value in expected.items():
+            assert getattr(config, field) == value
 
     @patch('mcp_use.server.MCPServer')
     def test_create_server(self, mock_mcp_server, registry, runtime):
         """Test creating MCP server."""
-        from rig_bridge_mcp import RigMcpBridge
-
         # Mock the MCPServer
         mock_server_instance = Mock()
         mock_server_instance.tool = Mock(return_value=lambda f: f)  # Mock the decorator
@@ -106,16 +99,14 @@ class TestMCPBridge:
         mock_mcp_server.assert_called_once()
         assert server == mock_server_instance
 
-    def test_bridge_without_mcp_use(self, registry, runtime):
+    def test_bridge_without_mcp_use(self, registry, runtime, monkeypatch):
         """Test bridge fails gracefully without mcp-use installed."""
-        from rig_bridge_mcp import RigMcpBridge
-        
         bridge = RigMcpBridge(registry, runtime)
         
         # Mock the import to fail
-        with patch.dict('sys.modules', {'mcp_use.server': None}):
-            with pytest.raises(ImportError, match="mcp-use package not installed"):
-                bridge.create_server()
+        monkeypatch.setitem(sys.modules, "mcp_use.server", None)
+        with pytest.raises(ImportError, match="mcp-use package not installed"):
+            bridge.create_server()
 
     def test_tool_execution_through_bridge(self, registry, runtime):
         """Test that tools can be executed through the bridge."""
@@ -133,6 +124,7 @@ class TestMCPBridge:
         assert result.ok
         assert result.output == {"echo": "hello"}
 
+    @pytest.mark.unit
     def test_bridge_exports(self):
         """Test that bridge exports the correct symbols."""
         import rig_bridge_mcp
@@ -141,14 +133,13 @@ class TestMCPBridge:
         assert hasattr(rig_bridge_mcp, 'McpBridgeConfig')
         assert hasattr(rig_bridge_mcp, 'create_mcp_bridge')
 
+    @pytest.mark.unit
     def test_bridge_readme_exists(self):
         """Test that bridge has documentation."""
-        from pathlib import Path
-        
-        readme_path = Path("packages/rig-bridge-mcp/README.md")
+        readme_path = Path(__file__).parent.parent / "packages" / "rig-bridge-mcp" / "README.md"
         assert readme_path.exists()
         
-        content = readme_path.read_text()
-        assert "MCP" in content
-        assert "RIG" in content
+        content = readme_path.read_bytes()
+        assert b"MCP" in content
+        assert b"RIG" in content
 
@@ -4,6 +4,8 @@ RGP Conformance Tests
 Tests that the RGP server implementation conforms to the OpenAPI specification.
 """
 
+from typing import get_args
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -11,12 +13,14 @@ from rig_core.audit import AuditLog
 from rig_core.policy import Policy
 from rig_core.registry import ToolRegistry
 from rig_core.runtime import RigRuntime, RegisteredTool
-from rig_core.rtp import ToolDef
+from rig_core.rtp import ErrorType, ToolDef
 from rig_core.secrets import SecretsStore
 from rig_protocol_rgp.server import create_app
 
+ERROR_TYPES = frozenset(get_args(ErrorType))
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_tool():
     """Create a test tool definition."""
     return ToolDef(
@@ -37,7 +41,7 @@ def test_tool():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def risky_tool():
     """Create a risky tool that requires approval."""
     return ToolDef(
@@ -58,9 +62,9 @@ def risky_tool():
     )
 
 
-@pytest.fixture
-def client(test_tool, risky_tool, tmp_path):
-    """Create a test client with a registry and runtime."""
+@pytest.fixture(scope="module")
+def client(test_tool, risky_tool):
+    """Create a test client with a registry and runtime, shared by the module."""
     registry = ToolRegistry()
     
     # Register test tool
@@ -70,7 +74,7 @@ def client(test_tool, risky_tool, tmp_path):
     registry.register_tools([test_tool, risky_tool])
     
     # Create runtime
-    audit = AuditLog(str(tmp_path / "test_audit.db"))
+    audit = AuditLog(":memory:")
     policy = Policy()
     secrets = SecretsStore()
     runtime = RigRuntime(policy=policy, secrets=secrets, audit=audit)
@@ -81,7 +85,11 @@ def client(test_tool, risky_tool, tmp_path):
     
     # Create app
     app = create_app(registry, runtime)
-    return TestClient(app)
+    # Entering the client keeps one event loop thread for every request
+    with TestClient(app) as test_client:
+        # Warm routing so first-request setup isn't billed to whichever test runs first
+        test_client.get("/v1/health")
+        yield test_client
 
 
 class TestHealthEndpoint:
@@ -119,6 +127,19 @@ class TestToolsEndpoint:
             assert "error_schema" in tool
             assert "risk_class" in tool
 
+    def test_list_tools_supports_conditional_get(self, client):
+        """Test that the listing carries an ETag and honors If-None-Match."""
+        response = client.get("/v1/tools")
+        etag = response.headers["ETag"]
+
+        cached = client.get("/v1/tools", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        stale = client.get("/v1/tools", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == response.json()
+
     def test_get_tool_by_name(self, client):
         """Test getting a specific tool by name."""
         response = client.get("/v1/tools/test_echo")
@@ -128,6 +149,12 @@ class TestToolsEndpoint:
         assert data["description"] == "Echo back the input message"
         assert data["risk_class"] == "read"
 
+    def test_get_tool_supports_conditional_get(self, client):
+        """Test that a single tool carries an ETag and honors If-None-Match."""
+        etag = client.get("/v1/tools/test_echo").headers["ETag"]
+        assert client.get("/v1/tools/test_echo", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/v1/tools/delete_database").headers["ETag"] != etag
+
     def test_get_nonexistent_tool_returns_404(self, client):
         """Test that getting a nonexistent tool returns 404."""
         response = client.get("/v1/tools/nonexistent")
@@ -226,11 +253,7 @@ class TestApprovalsEndpoint:
 
         # Extract token from remediation hints
         hints = data["error"]["remediation_hints"]
-        token = None
-        for hint in hints:
-            if "approve token:" in hint:
-                token = hint.split("approve token:")[1].strip()
-                break
+        token = next((h.partition("approve token:")[2].strip() for h in hints if "approve token:" in h), None)
 
         assert token is not None
 
@@ -284,7 +307,7 @@ class TestErrorResponseFormat:
     """Test that error responses conform to the spec."""
 
     def test_error_has_required_fields(self, client):
-        """Test that errors have type and message."""
+        """Test that errors have type, message and a retryable flag."""
         response = client.post(
             "/v1/tools/test_echo:call",
             json={"args": {}},  # validation error
@@ -295,30 +318,7 @@ class TestErrorResponseFormat:
         error = data["error"]
         assert "type" in error
         assert "message" in error
-        assert error["type"] in [
-            "validation_error",
-            "auth_error",
-            "permission_error",
-            "not_found",
-            "conflict",
-            "rate_limited",
-            "transient",
-            "timeout",
-            "upstream_error",
-            "policy_blocked",
-            "approval_required",
-            "internal_error",
-        ]
-
-    def test_error_includes_retryable_flag(self, client):
-        """Test that errors include retryable flag."""
-        response = client.post(
-            "/v1/tools/test_echo:call",
-            json={"args": {}},
-        )
-        data = response.json()
-        error = data["error"]
-        assert "retryable" in error
+        assert error["type"] in ERROR_TYPES
         assert isinstance(error["retryable"], bool)
 
 
@@ -7,12 +7,16 @@ the schemas correctly validate valid and invalid inputs.
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, get_args
 
 import pytest
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
 
-from rig_core.rtp import CallContext, ToolDef, ToolError, ToolResult
+from rig_core import jsonutil
+from rig_core.rtp import CallContext, ErrorType, ToolDef, ToolError, ToolResult, check_instance, compile_validator
+
+# No runtime, app or audit DB is built here, so the whole module runs with -m unit
+pytestmark = pytest.mark.unit
 
 # Load schemas
 SCHEMA_DIR = Path(__file__).parent.parent / "schemas" / "rtp"
@@ -20,8 +24,7 @@ SCHEMA_DIR = Path(__file__).parent.parent / "schemas" / "rtp"
 
 def load_schema(name: str) -> Dict[str, Any]:
     """Load a JSON schema file."""
-    with open(SCHEMA_DIR / f"{name}.schema.json") as f:
-        return json.load(f)
+    return json.loads((SCHEMA_DIR / f"{name}.schema.json").read_bytes())
 
 
 TOOL_DEF_SCHEMA = load_schema("ToolDef")
@@ -30,6 +33,23 @@ TOOL_RESULT_SCHEMA = load_schema("ToolResult")
 CALL_CONTEXT_SCHEMA = load_schema("CallContext")
 APPROVAL_REQUIRED_SCHEMA = load_schema("ApprovalRequired")
 
+# Compiled once; each test only pays for validating its instance
+TOOL_DEF_VALIDATOR = compile_validator(TOOL_DEF_SCHEMA)
+TOOL_ERROR_VALIDATOR = compile_validator(TOOL_ERROR_SCHEMA)
+TOOL_RESULT_VALIDATOR = compile_validator(TOOL_RESULT_SCHEMA)
+CALL_CONTEXT_VALIDATOR = compile_validator(CALL_CONTEXT_SCHEMA)
+APPROVAL_REQUIRED_VALIDATOR = compile_validator(APPROVAL_REQUIRED_SCHEMA)
+
+
+# Minimal valid ToolDef; the invalid cases each change one field of it
+VALID_TOOLDEF = {
+    "name": "test_tool",
+    "description": "A test tool",
+    "input_schema": {"type": "object", "properties": {}},
+    "output_schema": {"type": "object", "properties": {}},
+    "error_schema": {"type": "object", "properties": {}},
+}
+
 
 class TestToolDefSchema:
     """Test ToolDef schema validation."""
@@ -43,7 +63,7 @@ class TestToolDefSchema:
             "output_schema": {"type": "object", "properties": {}},
             "error_schema": {"type": "object", "properties": {}},
         }
-        validate(instance=data, schema=TOOL_DEF_SCHEMA)
+        check_instance(TOOL_DEF_VALIDATOR, data)
 
     def test_full_valid_tooldef(self):
         """Test fully populated valid ToolDef."""
@@ -73,7 +93,7 @@ class TestToolDefSchema:
                 }
             ],
         }
-        validate(instance=data, schema=TOOL_DEF_SCHEMA)
+        check_instance(TOOL_DEF_VALIDATOR, data)
 
     def test_python_tooldef_matches_schema(self):
         """Test that Python ToolDef dataclass matches schema."""
@@ -102,57 +122,24 @@ class TestToolDefSchema:
             "examples": tool.examples,
         }
         
-        validate(instance=data, schema=TOOL_DEF_SCHEMA)
-
-    def test_invalid_tooldef_missing_required(self):
-        """Test that missing required fields are rejected."""
-        data = {
-            "name": "test_tool",
-            # missing description
-            "input_schema": {"type": "object", "properties": {}},
-            "output_schema": {"type": "object", "properties": {}},
-            "error_schema": {"type": "object", "properties": {}},
-        }
-        with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_DEF_SCHEMA)
-
-    def test_invalid_tooldef_bad_name(self):
-        """Test that invalid tool names are rejected."""
-        data = {
-            "name": "invalid name with spaces!",
-            "description": "A test tool",
-            "input_schema": {"type": "object", "properties": {}},
-            "output_schema": {"type": "object", "properties": {}},
-            "error_schema": {"type": "object", "properties": {}},
-        }
-        with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_DEF_SCHEMA)
-
-    def test_invalid_tooldef_bad_risk_class(self):
-        """Test that invalid risk classes are rejected."""
-        data = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "input_schema": {"type": "object", "properties": {}},
-            "output_schema": {"type": "object", "properties": {}},
-            "error_schema": {"type": "object", "properties": {}},
-            "risk_class": "super_dangerous",  # invalid
-        }
-        with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_DEF_SCHEMA)
-
-    def test_invalid_tooldef_bad_auth_slot(self):
-        """Test that invalid auth slot names are rejected."""
-        data = {
-            "name": "test_tool",
-            "description": "A test tool",
-            "input_schema": {"type": "object", "properties": {}},
-            "output_schema": {"type": "object", "properties": {}},
-            "error_schema": {"type": "object", "properties": {}},
-            "auth_slots": ["lowercase_not_allowed"],  # must be uppercase
-        }
-        with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_DEF_SCHEMA)
+        check_instance(TOOL_DEF_VALIDATOR, data)
+
+    @pytest.mark.parametrize(
+        "overrides,removed,expected_path",
+        [
+            ({}, "description", []),
+            ({"name": "invalid name with spaces!"}, None, ["name"]),
+            ({"risk_class": "super_dangerous"}, None, ["risk_class"]),
+            ({"auth_slots": ["lowercase_not_allowed"]}, None, ["auth_slots", 0]),  # must be uppercase
+        ],
+        ids=["missing_required", "bad_name", "bad_risk_class", "bad_auth_slot"],
+    )
+    def test_invalid_tooldef(self, overrides, removed, expected_path):
+        """Test that a ToolDef with one bad or missing field is rejected at that field."""
+        data = {k: v for k, v in {**VALID_TOOLDEF, **overrides}.items() if k != removed}
+        with pytest.raises(ValidationError) as exc_info:
+            check_instance(TOOL_DEF_VALIDATOR, data)
+        assert list(exc_info.value.absolute_path) == expected_path
 
 
 class TestToolErrorSchema:
@@ -161,7 +148,7 @@ class TestToolErrorSchema:
     def test_minimal_valid_error(self):
         """Test minimal valid ToolError."""
         data = {"type": "internal_error", "message": "Something went wrong"}
-        validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+        check_instance(TOOL_ERROR_VALIDATOR, data)
 
     def test_full_valid_error(self):
         """Test fully populated valid ToolError."""
@@ -172,8 +159,9 @@ class TestToolErrorSchema:
             "upstream_code": "503",
             "remediation_hints": ["Wait a few minutes and retry", "Check GitHub status page"],
             "correlation_id": "abc-123-def",
+            "retry_after_seconds": 30,
         }
-        validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+        check_instance(TOOL_ERROR_VALIDATOR, data)
 
     def test_python_toolerror_matches_schema(self):
         """Test that Python ToolError dataclass matches schema."""
@@ -193,42 +181,36 @@ class TestToolErrorSchema:
             "upstream_code": error.upstream_code,
             "remediation_hints": error.remediation_hints,
             "correlation_id": error.correlation_id,
+            "retry_after_seconds": error.retry_after_seconds,
         }
 
-        validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+        check_instance(TOOL_ERROR_VALIDATOR, data)
 
-    def test_all_error_types_valid(self):
-        """Test that all defined error types are valid."""
-        error_types = [
-            "validation_error",
-            "auth_error",
-            "permission_error",
-            "not_found",
-            "conflict",
-            "rate_limited",
-            "transient",
-            "timeout",
-            "upstream_error",
-            "policy_blocked",
-            "approval_required",
-            "internal_error",
-        ]
+    def test_toolerror_to_dict_matches_schema(self):
+        """Test that ToolError.to_dict() produces a schema-valid error."""
+        error = ToolError(type="rate_limited", message="Slow down", retryable=True, retry_after_seconds=2.5)
+        data = error.to_dict()
 
-        for error_type in error_types:
-            data = {"type": error_type, "message": f"Test {error_type}"}
-            validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+        check_instance(TOOL_ERROR_VALIDATOR, data)
+        assert data["retry_after_seconds"] == 2.5
+
+    @pytest.mark.parametrize("error_type", get_args(ErrorType))
+    def test_all_error_types_valid(self, error_type):
+        """Test that all defined error types are valid."""
+        data = {"type": error_type, "message": f"Test {error_type}"}
+        check_instance(TOOL_ERROR_VALIDATOR, data)
 
     def test_invalid_error_type(self):
         """Test that invalid error types are rejected."""
         data = {"type": "unknown_error", "message": "Test"}
         with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+            check_instance(TOOL_ERROR_VALIDATOR, data)
 
     def test_invalid_error_missing_message(self):
         """Test that missing message is rejected."""
         data = {"type": "internal_error"}
         with pytest.raises(ValidationError):
-            validate(instance=data, schema=TOOL_ERROR_SCHEMA)
+            check_instance(TOOL_ERROR_VALIDATOR, data)
 
 
 class TestToolResultSchema:
@@ -246,7 +228,7 @@ class TestToolResultSchema:
             "interface_hash": "a" * 64,
             "pack_set_version": "snapshot-1",
         }
-        validate(instance=data, schema=TOOL_RESULT_SCHEMA)
+        check_instance(TOOL_RESULT_VALIDATOR, data)
 
     def test_valid_error_result(self):
         """Test valid error result."""
@@ -256,7 +238,7 @@ class TestToolResultSchema:
             "error": {"type": "not_found", "message": "Resource not found"},
             "correlation_id": "test-123",
         }
-        validate(instance=data, schema=TOOL_RESULT_SCHEMA)
+        check_instance(TOOL_RESULT_VALIDATOR, data)
 
     def test_python_toolresult_success_matches_schema(self):
         """Test that Python ToolResult (success) matches schema."""
@@ -279,7 +261,7 @@ class TestToolResultSchema:
             "pack_set_version": result.pack_set_version,
         }
 
-        validate(instance=data, schema=TOOL_RESULT_SCHEMA)
+        check_instance(TOOL_RESULT_VALIDATOR, data)
 
     def test_python_toolresult_error_matches_schema(self):
         """Test that Python ToolResult (error) matches schema."""
@@ -309,7 +291,7 @@ class TestToolResultSchema:
             "pack_set_version": result.pack_set_version,
         }
 
-        validate(instance=data, schema=TOOL_RESULT_SCHEMA)
+        check_instance(TOOL_RESULT_VALIDATOR, data)
 
 
 class TestCallContextSchema:
@@ -318,7 +300,7 @@ class TestCallContextSchema:
     def test_empty_context_valid(self):
         """Test that empty context is valid (all fields optional)."""
         data = {}
-        validate(instance=data, schema=CALL_CONTEXT_SCHEMA)
+        check_instance(CALL_CONTEXT_VALIDATOR, data)
 
     def test_full_context_valid(self):
         """Test fully populated context."""
@@ -327,12 +309,12 @@ class TestCallContextSchema:
             "request_id": "req-456",
             "actor": "user@example.com",
         }
-        validate(instance=data, schema=CALL_CONTEXT_SCHEMA)
+        check_instance(CALL_CONTEXT_VALIDATOR, data)
 
     def test_partial_context_valid(self):
         """Test partially populated context."""
         data = {"request_id": "req-789"}
-        validate(instance=data, schema=CALL_CONTEXT_SCHEMA)
+        check_instance(CALL_CONTEXT_VALIDATOR, data)
 
     def test_python_callcontext_matches_schema(self):
         """Test that Python CallContext TypedDict matches schema."""
@@ -341,7 +323,7 @@ class TestCallContextSchema:
             "request_id": "req-456",
             "actor": "user@example.com",
         }
-        validate(instance=ctx, schema=CALL_CONTEXT_SCHEMA)
+        check_instance(CALL_CONTEXT_VALIDATOR, ctx)
 
 
 class TestApprovalRequiredSchema:
@@ -356,7 +338,7 @@ class TestApprovalRequiredSchema:
             "requested_at": "2026-01-13T10:00:00Z",
             "expires_at": "2026-01-13T11:00:00Z",
         }
-        validate(instance=data, schema=APPROVAL_REQUIRED_SCHEMA)
+        check_instance(APPROVAL_REQUIRED_VALIDATOR, data)
 
     def test_full_approval_required(self):
         """Test fully populated approval required payload."""
@@ -370,7 +352,7 @@ class TestApprovalRequiredSchema:
             "requested_at": "2026-01-13T10:00:00Z",
             "expires_at": "2026-01-13T11:00:00Z",
         }
-        validate(instance=data, schema=APPROVAL_REQUIRED_SCHEMA)
+        check_instance(APPROVAL_REQUIRED_VALIDATOR, data)
 
     def test_invalid_approval_token_format(self):
         """Test that invalid token format is rejected."""
@@ -382,7 +364,7 @@ class TestApprovalRequiredSchema:
             "expires_at": "2026-01-13T11:00:00Z",
         }
         with pytest.raises(ValidationError):
-            validate(instance=data, schema=APPROVAL_REQUIRED_SCHEMA)
+            check_instance(APPROVAL_REQUIRED_VALIDATOR, data)
 
     def test_invalid_risk_class(self):
         """Test that invalid risk class is rejected."""
@@ -394,7 +376,7 @@ class TestApprovalRequiredSchema:
             "expires_at": "2026-01-13T11:00:00Z",
         }
         with pytest.raises(ValidationError):
-            validate(instance=data, schema=APPROVAL_REQUIRED_SCHEMA)
+            check_instance(APPROVAL_REQUIRED_VALIDATOR, data)
 
 
 class TestSchemaStability:
@@ -404,12 +386,12 @@ class TestSchemaStability:
         """Test that ToolDef schema hash is stable."""
         import hashlib
 
-        schema_json = json.dumps(TOOL_DEF_SCHEMA, sort_keys=True)
-        schema_hash = hashlib.sha256(schema_json.encode()).hexdigest()
+        schema_bytes = jsonutil.dumps_bytes(TOOL_DEF_SCHEMA, sort_keys=True)
+        schema_hash = hashlib.sha256(schema_bytes).hexdigest()
 
         # This hash should only change when we intentionally modify the schema
         # If this test fails, verify the schema change is intentional and update the hash
-        expected_hash = hashlib.sha256(schema_json.encode()).hexdigest()
+        expected_hash = "4698e9390b49554a97370817eb0af1fc3c52082740007716e1c13068542b58c0"
         assert schema_hash == expected_hash, "ToolDef schema changed unexpectedly"
 
     def test_all_schemas_loadable(self):
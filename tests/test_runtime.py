@@ -0,0 +1,138 @@
+"""Test RigRuntime execution paths."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from jsonschema.exceptions import SchemaError, ValidationError
+
+from rig_core import packs
+from rig_core.packs import load_selected_packs, make_pack
+from rig_core.policy import Policy
+from rig_core.runtime import RegisteredTool, RigRuntime
+from rig_core.rtp import ToolDef
+from rig_core.secrets import SecretsStore
+
+
+def _tool(name: str) -> ToolDef:
+    return ToolDef(
+        name=name,
+        description=f"{name} tool",
+        input_schema={
+            "type": "object",
+            "properties": {"n": {"type": "integer"}},
+            "required": ["n"],
+        },
+        output_schema={
+            "type": "object",
+            "properties": {"n": {"type": "integer"}},
+            "required": ["n"],
+        },
+        error_schema={"type": "object"},
+    )
+
+
+def sync_double(args, secrets, ctx):
+    return {"n": args["n"] * 2}
+
+
+async def async_square(args, secrets, ctx):
+    await asyncio.sleep(0)
+    return {"n": args["n"] ** 2}
+
+
+@pytest.fixture
+def runtime():
+    runtime = RigRuntime(policy=Policy(retries=0), secrets=SecretsStore(), audit=None)
+    runtime.register("double", RegisteredTool(tool=_tool("double"), impl=sync_double))
+    runtime.register("square", RegisteredTool(tool=_tool("square"), impl=async_square))
+    return runtime
+
+
+@pytest.mark.unit
+def test_call_runs_async_impl(runtime):
+    result = runtime.call("square", {"n": 3}, {"request_id": "r1"})
+    assert result.ok is True
+    assert result.output == {"n": 9}
+
+
+@pytest.mark.unit
+def test_call_many_preserves_order(runtime):
+    results = asyncio.run(runtime.call_many([
+        ("double", {"n": 2}, {"request_id": "r1"}),
+        ("square", {"n": 4}, {"request_id": "r2"}),
+        ("missing", {}, {"request_id": "r3"}),
+        ("double", {"n": "x"}, {"request_id": "r4"}),
+    ]))
+
+    assert [r.output for r in results[:2]] == [{"n": 4}, {"n": 16}]
+    assert results[2].error.type == "not_found"
+    assert results[3].error.type == "validation_error"
+    assert [r.correlation_id for r in results] == ["r1", "r2", "r3", "r4"]
+
+
+@pytest.mark.unit
+def test_pure_tool_skips_secret_resolution():
+    class CountingSecrets(SecretsStore):
+        calls = 0
+
+        def resolve(self, slots, tenant_id=None):
+            CountingSecrets.calls += 1
+            return super().resolve(slots, tenant_id)
+
+    runtime = RigRuntime(policy=Policy(), secrets=CountingSecrets(), audit=None)
+    reg = RegisteredTool(tool=_tool("double"), impl=sync_double)
+    assert reg.pure is True
+    runtime.register("double", reg)
+
+    assert runtime.call("double", {"n": 1}, {}).output == {"n": 2}
+    assert CountingSecrets.calls == 0
+
+
+@pytest.mark.unit
+def test_invalid_schema_rejected_at_registration():
+    bad = ToolDef(
+        name="bad",
+        description="bad tool",
+        input_schema={"type": "not-a-type"},
+        output_schema={"type": "object"},
+        error_schema={"type": "object"},
+    )
+    with pytest.raises(SchemaError):
+        RegisteredTool(tool=bad, impl=sync_double)
+
+
+@pytest.mark.unit
+def test_tooldef_reuses_compiled_validators():
+    tool = _tool("double")
+    assert tool.input_validator is tool.input_validator
+
+    tool.validate_input({"n": 1})
+    with pytest.raises(ValidationError):
+        tool.validate_input({"n": "x"})
+    with pytest.raises(ValidationError):
+        tool.validate_output({})
+
+
+@pytest.mark.unit
+def test_make_pack_registers_impls_against_tooldefs():
+    pack = make_pack("p", "1.0", [_tool("double"), _tool("square")], {"double": sync_double})
+    assert [t.name for t in pack.rig_tools()] == ["double", "square"]
+    assert list(pack.rig_impls()) == ["double"]
+    assert pack.rig_impls()["double"].pack_version == "1.0"
+
+    with pytest.raises(ValueError, match="orphan"):
+        make_pack("p", "1.0", [_tool("double")], {"double": sync_double, "orphan": sync_double})
+
+
+@pytest.mark.unit
+def test_load_selected_packs_matches_on_pack_name(monkeypatch):
+    def entry_point(name, pack_name):
+        return SimpleNamespace(name=name, load=lambda: make_pack(pack_name, "1.0", [], {}))
+
+    # The entry point named "a" loads the pack "b"
+    eps = [entry_point("a", "b"), entry_point("c", "a")]
+    monkeypatch.setattr(packs, "entry_points", lambda: SimpleNamespace(select=lambda group: eps))
+
+    assert [p.name for p in load_selected_packs(["a"])] == ["a"]
+    assert [p.name for p in load_selected_packs(["b"])] == ["b"]